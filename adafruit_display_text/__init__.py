@@ -19,6 +19,10 @@ try:
 except ImportError:
     pass
 
+# how long the run() coroutines of Animator and RefreshCoalescer sleep while they have
+# nothing to do, in milliseconds
+_IDLE_SLEEP = 100
+
 
 def wrap_text_to_pixels(
     string: str,
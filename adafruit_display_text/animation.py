@@ -0,0 +1,273 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_display_text.animation`
+================================================================================
+
+Drive the scrolling animation of many labels from one place
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
+
+import adafruit_ticks
+from micropython import const
+
+from adafruit_display_text import _IDLE_SLEEP
+
+try:
+    from heapq import heappop, heappush
+except ImportError:
+
+    def heappush(heap: list, item) -> None:
+        """Push item onto heap, maintaining the heap invariant."""
+        heap.append(item)
+        index = len(heap) - 1
+        while index:
+            parent = (index - 1) >> 1
+            if not item < heap[parent]:
+                break
+            heap[index] = heap[parent]
+            index = parent
+        heap[index] = item
+
+    def heappop(heap: list):
+        """Pop the smallest item off the heap, maintaining the heap invariant."""
+        last = heap.pop()
+        if not heap:
+            return last
+        smallest = heap[0]
+        index = 0
+        size = len(heap)
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < last:
+                break
+            heap[index] = heap[child]
+            index = child
+        heap[index] = last
+        return smallest
+
+
+try:
+    from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+    from adafruit_display_text.bitmap_label import Label
+except ImportError:
+    pass
+
+# ticks_ms() values wrap around to 0 after this one
+_TICKS_MAX = const((1 << 29) - 1)
+
+
+class Animator:
+    """Updates the animation of many :py:class:`~adafruit_display_text.bitmap_label.Label`
+    objects with one call. The clock is read once per call to :py:meth:`update` and only the
+    labels whose ``animate_time`` has elapsed are visited, so the cost of an update does not
+    grow with the number of labels that are waiting.
+
+    A label must not be added to more than one Animator. Calling the label's own ``update()``
+    is still allowed, the Animator notices that the label's next frame moved.
+
+    The labels must be created with the same ``clock`` as the Animator.
+
+    :param Iterable[Label] labels: Labels to animate. Default is none, more labels can be
+     added with :py:meth:`add`.
+    :param Optional[Callable[[], int]] clock: Function returning the current time in
+     milliseconds, in the form of ``adafruit_ticks.ticks_ms()``. For example a
+     :py:class:`ManualClock`. Default is None, ``adafruit_ticks.ticks_ms``.
+    """
+
+    def __init__(
+        self, labels: Iterable[Label] = (), clock: Optional[Callable[[], int]] = None
+    ) -> None:
+        # (deadline, sequence number, label) tuples, the sequence number breaks ties and
+        # marks entries of removed or rescheduled labels as stale
+        self._heap = []
+        # id(label): (sequence number of its current heap entry, label)
+        self._sequence = {}
+        self._next_sequence = 0
+        # deadlines are kept in milliseconds of an internal clock that does not wrap around
+        self._clock = adafruit_ticks.ticks_ms if clock is None else clock
+        self._last_ticks = self._clock()
+        self._time = 0
+        for label in labels:
+            self.add(label)
+
+    def _advance_clock(self, now: Optional[int] = None) -> int:
+        # Read the clock and advance the internal time, returns the ticks_ms() value
+        if now is None:
+            now = self._clock()
+        self._time += adafruit_ticks.ticks_diff(now, self._last_ticks)
+        self._last_ticks = now
+        return now
+
+    def _schedule(self, label: Label, now: int) -> None:
+        wait = adafruit_ticks.ticks_diff(label._next_animate_time(), now)
+        # the next frame is never more than animate_time away, even if the label was last
+        # updated with a different clock
+        wait = min(max(wait, 0), int(label.animate_time * 1000))
+        self._next_sequence += 1
+        self._sequence[id(label)] = (self._next_sequence, label)
+        heappush(self._heap, (self._time + wait, self._next_sequence, label))
+
+    def add(self, label: Label) -> None:
+        """Start animating a label. Adding a label again reschedules it, which is needed
+        after making its ``animate_time`` shorter.
+
+        :param Label label: The label to animate
+        """
+        self._schedule(label, self._advance_clock())
+
+    def remove(self, label: Label) -> None:
+        """Stop animating a label.
+
+        :param Label label: The label to stop animating
+        """
+        del self._sequence[id(label)]
+        if not self._sequence:
+            self._heap = []
+
+    @property
+    def labels(self) -> List[Label]:
+        """The labels being animated."""
+        return [entry[1] for entry in self._sequence.values()]
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    def update(
+        self, limit: Optional[int] = None, now: Optional[int] = None
+    ) -> Tuple[bool, List[Label]]:
+        """Update the labels whose next animation frame is due. Must be called in the main
+        loop of user code instead of the ``update()`` of each label.
+
+        :param Optional[int] limit: Update at most this many labels, the others stay due
+         for the next call. Default is None, update all the labels that are due.
+        :param Optional[int] now: The current time in the form of ``adafruit_ticks.ticks_ms()``.
+         Default is None, read the ``clock`` of the Animator.
+        :return: Whether the display needs to be refreshed, and the list of labels that changed
+        :rtype: Tuple[bool, List[Label]]
+        """
+        now = self._advance_clock(now)
+        heap = self._heap
+        sequence = self._sequence
+        changed = []
+        visited = 0
+        while heap and heap[0][0] < self._time and visited != limit:
+            _, entry_sequence, label = heappop(heap)
+            if sequence.get(id(label), (None,))[0] != entry_sequence:
+                continue  # removed or rescheduled
+            visited += 1
+            if label._animate(now):
+                changed.append(label)
+            self._schedule(label, now)
+        return bool(changed), changed
+
+    @property
+    def time_to_update(self) -> Optional[float]:
+        """Time, in fractional seconds, until the next label is due to be updated.
+        0 when a label is due now, None when there are no labels."""
+        self._advance_clock()
+        heap = self._heap
+        while heap and self._sequence.get(id(heap[0][2]), (None,))[0] != heap[0][1]:
+            heappop(heap)  # drop the entries of removed or rescheduled labels
+        if not heap:
+            return None
+        # a label is due once the clock has passed its deadline
+        return max(heap[0][0] + 1 - self._time, 0) / 1000
+
+    async def run(self, on_refresh: Optional[Callable[[], None]] = None) -> None:
+        """Coroutine that animates the labels forever, sleeping until the next label is due.
+        Run it as an ``asyncio`` task next to the other tasks of the program. Each due label
+        is updated in its own step, so that other tasks can run between the renders.
+        The labels that use ``double_buffer`` draw their next frame ahead after each refresh.
+        Requires the ``asyncio`` library.
+
+        :param Optional[Callable[[], None]] on_refresh: Called after labels changed, for
+         example ``display.refresh`` when ``auto_refresh`` is off. Default is None.
+        """
+        import asyncio  # noqa: PLC0415, only loaded by programs that run the animator this way
+
+        while True:
+            changed = []
+            while self.time_to_update == 0:
+                changed.extend(self.update(limit=1)[1])
+                await asyncio.sleep(0)
+            if changed and on_refresh is not None:
+                on_refresh()
+            for label in changed:
+                label.render_ahead()
+            wait = self.time_to_update
+            await asyncio.sleep(_IDLE_SLEEP / 1000 if wait is None else wait)
+
+
+class ManualClock:
+    """A clock that only moves when told to, for stepping through animation frames in
+    tests and benchmarks. Pass it as the ``clock`` of a
+    :py:class:`~adafruit_display_text.bitmap_label.Label` or an :py:class:`Animator`.
+    Calling it returns the current time in the form of ``adafruit_ticks.ticks_ms()``,
+    wrapping around the same way.
+
+    :param int start: The initial value returned. Default is 0.
+    """
+
+    def __init__(self, start: int = 0) -> None:
+        self._ticks = start & _TICKS_MAX
+        self._elapsed = 0
+
+    def __call__(self) -> int:
+        return self._ticks
+
+    def advance(self, milliseconds: int) -> None:
+        """Move the clock forward.
+
+        :param int milliseconds: How far to move the clock
+        """
+        self._ticks = (self._ticks + milliseconds) & _TICKS_MAX
+        self._elapsed += milliseconds
+
+    @property
+    def elapsed(self) -> int:
+        """Milliseconds the clock was advanced since it was created, without wrapping."""
+        return self._elapsed
+
+    def step(self, target: Union[Label, Animator], duration: int, frame_time: int) -> int:
+        """Simulate running the main loop of a program for a while, updating ``target``
+        every ``frame_time`` milliseconds of virtual time.
+
+        :param Label|Animator target: The label or Animator to update. It must use this clock.
+        :param int duration: How many milliseconds to advance the clock in total
+        :param int frame_time: How many milliseconds to advance the clock between updates
+        :return: The number of updates after which the display needed a refresh
+        :rtype: int
+        """
+        refreshes = 0
+        while duration > 0:
+            step = min(frame_time, duration)
+            self.advance(step)
+            duration -= step
+            updated = target.update()
+            if updated[0] if isinstance(updated, tuple) else updated:
+                refreshes += 1
+        return refreshes
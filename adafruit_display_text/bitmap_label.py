@@ -27,6 +27,8 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
 
+import sys
+
 import adafruit_ticks
 import displayio
 from micropython import const
@@ -37,12 +39,21 @@ try:
     import bitmaptools
 except ImportError:
     # We have a slower fallback for bitmaptools
-    pass
+    bitmaptools = None
+
+if sys.implementation.name == "cpython":
+    try:
+        # On hosts with NumPy its versions of the bitmaptools functions are faster
+        from adafruit_display_text import numpy_bitmaptools as bitmaptools
+    except ImportError:
+        pass
 
 try:
-    from typing import Optional, Tuple
+    from typing import Callable, List, Optional, Tuple, Union
 
     from fontio import FontProtocol
+
+    from adafruit_display_text.bitmap_pool import BitmapPool
 except ImportError:
     pass
 
@@ -53,8 +64,98 @@ ACCENT_FG = const(2)
 ACCENT_BG = const(3)
 ACCENT_TYPE = const(4)
 
-
-class Label(LabelBase):
+# automatic capacity grows the bitmap in steps of this many pixels
+_CAPACITY_STEP = const(8)
+
+# accented glyphs are drawn into scratch Bitmaps shared by all labels, keep this many
+_SCRATCH_BITMAP_COUNT = const(4)
+_scratch_bitmaps = {}
+
+# flags for the changes that have not been rendered yet
+_DIRTY_TEXT = const(1)
+_DIRTY_STYLE = const(2)
+_DIRTY_ACCENTS = const(4)
+_DIRTY_GEOMETRY = const(8)
+
+# TileGrid tile values go up to 255, so the strip and ring Bitmaps shown as one pixel
+# wide tiles can be at most this many pixels wide
+_MAX_TILE_COLUMNS = const(256)
+
+# damaged areas extending to the right or bottom edge of the TileGrid end here
+_DAMAGE_EDGE = const(0x7FFF)
+
+
+def _pixel_buffer(bitmap: displayio.Bitmap) -> Optional[memoryview]:
+    # The pixels of the bitmap as a memoryview with one byte per pixel and no row padding,
+    # or None if its memory is not laid out like that. Only CircuitPython Bitmaps with more
+    # than 16 values and a width that is a multiple of 4 qualify: glyph Bitmaps use one bit
+    # per pixel, label Bitmaps with the default palette two, and Blinka Bitmaps have no
+    # buffer at all.
+    if getattr(bitmap, "bits_per_value", None) != 8:
+        return None
+    try:
+        pixels = memoryview(bitmap)
+    except TypeError:
+        return None
+    if len(pixels) != bitmap.width * bitmap.height:
+        return None
+    return pixels
+
+
+def _fill_region(bitmap: displayio.Bitmap, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+    # Set the pixels of the rectangle from (x1, y1) inclusive to (x2, y2) exclusive to
+    # value, with bitmaptools when it is available
+    if hasattr(bitmaptools, "fill_region"):
+        bitmaptools.fill_region(bitmap, x1, y1, x2, y2, value)
+        return
+    if x1 <= 0 and y1 <= 0 and x2 >= bitmap.width and y2 >= bitmap.height:
+        bitmap.fill(value)
+        return
+    x1, y1 = max(x1, 0), max(y1, 0)
+    x2, y2 = min(x2, bitmap.width), min(y2, bitmap.height)
+    if x1 >= x2:
+        return
+    pixels = _pixel_buffer(bitmap)
+    if pixels is not None:
+        row = bytes((value,)) * (x2 - x1)
+    for y in range(y1, y2):
+        if pixels is not None:
+            start = y * bitmap.width + x1
+            pixels[start : start + x2 - x1] = row
+            continue
+        for x in range(x1, x2):
+            bitmap[x, y] = value
+
+
+def _union_area(
+    area: Optional[Tuple[int, int, int, int]], other: Optional[Tuple[int, int, int, int]]
+) -> Optional[Tuple[int, int, int, int]]:
+    # The smallest (x1, y1, x2, y2) area containing both areas, either can be None
+    if area is None:
+        return other
+    if other is None:
+        return area
+    return (
+        min(area[0], other[0]),
+        min(area[1], other[1]),
+        max(area[2], other[2]),
+        max(area[3], other[3]),
+    )
+
+
+def _scratch_bitmap(width: int, height: int, value_count: int) -> displayio.Bitmap:
+    # A shared scratch Bitmap of at least this size, its contents are undefined
+    key = (width, height, value_count)
+    scratch = _scratch_bitmaps.get(key)
+    if scratch is None:
+        if len(_scratch_bitmaps) >= _SCRATCH_BITMAP_COUNT:
+            _scratch_bitmaps.clear()
+        scratch = displayio.Bitmap(width, height, value_count)
+        _scratch_bitmaps[key] = scratch
+    return scratch
+
+
+class Label(LabelBase):  # noqa: PLR0904, too many public methods
     """A label displaying a string of text that is stored in a bitmap.
     Note: This ``bitmap_label.py`` library utilizes a :py:class:`~displayio.Bitmap`
     to display the text. This method is memory-conserving relative to ``label.py``.
@@ -114,6 +215,9 @@ class Label(LabelBase):
       respectively. Indexes 3 and above can be used for accent colors. ``color``,
       ``background_color``, and ``outline_color`` arguments will be ignored if
       ``color_palette`` is used.
+    :param int accent_slots: Number of accents that can have label-managed colors at the same
+      time, see ``add_accent_color_range``. Each one uses two palette entries, taken from the
+      end of ``color_palette`` or added to the palette the label creates. Default is 0.
     :param Optional[int] ax_characters: The number of characters that sets the fixed-width.
       Default is None for unlimited width and no scrolling
 
@@ -121,6 +225,55 @@ class Label(LabelBase):
      frames. Default is 0.3 seconds.
     :param int current_index: The index of the first visible character in the label.
      Default is 0, the first character. Will increase while scrolling.
+    :param Optional[Union[Tuple(int, int), int]] capacity: Keep rendering into the same
+     Bitmap while the size of the text changes, instead of allocating a new one every time
+     the size changes. Either a ``(width, height)`` tuple with the fixed Bitmap size in
+     pixels, or ``Label.CAPACITY_AUTO`` to grow the Bitmap in steps of 8 pixels and never
+     shrink it. Text that does not fit a fixed capacity is clipped. The background color
+     covers the whole capacity, ``bounding_box`` only covers the text.
+     Default is None, the Bitmap always matches the size of the text.
+    :param int scroll_mode: How the text scrolls when it is longer than ``max_characters``.
+     ``Label.SCROLL_CHARACTERS`` renders the visible characters again on every animation
+     frame. ``Label.SCROLL_STRIP`` renders the full text once into a wide Bitmap and only
+     moves the visible window over it on every frame, this is much faster but needs a
+     Bitmap as wide as the full text. ``Label.SCROLL_RING`` uses a Bitmap only a little
+     wider than the visible window as a ring buffer and renders each character once as it
+     scrolls into view, so memory use does not depend on the length of the text.
+     Both show their Bitmap as one pixel wide tiles, so it can be at most 256 pixels wide:
+     ``SCROLL_STRIP`` suits text up to about 256 pixels wide minus the visible window, and
+     ``SCROLL_RING`` a visible window up to about 256 pixels minus two characters wide.
+     A ``ValueError`` is raised when the Bitmap would be wider.
+     ``SCROLL_STRIP`` and ``SCROLL_RING`` are not supported with the ``RTL`` label_direction.
+     Default is ``Label.SCROLL_CHARACTERS``.
+    :param Optional[float] scroll_speed: Scroll smoothly by whole pixels at this many pixels
+     per second instead of by one character per frame. ``animate_time`` sets the time between
+     frames. Requires ``scroll_mode`` ``Label.SCROLL_STRIP`` or ``Label.SCROLL_RING``, and
+     is not supported with the ``RTL`` label_direction.
+     Default is None.
+    :param Optional[BitmapPool] bitmap_pool: A
+     :py:class:`~adafruit_display_text.bitmap_pool.BitmapPool` shared between labels.
+     The Bitmap is taken from the pool and handed back to it when the text becomes empty,
+     the Bitmap is resized or `deinit()` is called. Default is None, no pooling.
+    :param Optional[Callable[[], int]] clock: Function returning the current time in
+     milliseconds, in the form of ``adafruit_ticks.ticks_ms()``, used to time the animation.
+     For example an :py:class:`~adafruit_display_text.animation.ManualClock` to step
+     through frames in tests. Default is None, ``adafruit_ticks.ticks_ms``.
+    :param Optional[int] catch_up: When scrolling by characters, if several ``animate_time``
+     intervals passed since the last frame, for example after a slow iteration of the main
+     loop, scroll by that many characters at once, up to ``catch_up`` of them, and only
+     render the last position. The scrolling then keeps pace with the clock instead of
+     falling behind. Default is None, scroll by one character per frame.
+    :param bool coalesce: Only record changes of the text and style, and render the latest
+     state once :py:meth:`update` or :py:meth:`flush` is called, so that values which are
+     replaced before then are never drawn. Useful for e-ink displays, which can only be
+     refreshed every few seconds. See
+     :py:class:`~adafruit_display_text.refresh.RefreshCoalescer`. Default is False.
+    :param bool double_buffer: Draw each new frame into a second Bitmap of the same size and
+     only then show it, so the display never shows a half drawn frame. The next frame of a
+     label that scrolls by characters can also be drawn ahead of time with
+     :py:meth:`render_ahead`, then ``update()`` only has to show it. Uses twice the Bitmap
+     memory, and works best with ``capacity`` so that every frame has the same Bitmap size.
+     Default is False.
 
     """
 
@@ -133,6 +286,12 @@ class Label(LabelBase):
         "RTL": (False, False, False),
     }
 
+    CAPACITY_AUTO = const(-1)
+
+    SCROLL_CHARACTERS = const(0)
+    SCROLL_STRIP = const(1)
+    SCROLL_RING = const(2)
+
     def __init__(
         self,
         font: FontProtocol,
@@ -143,11 +302,71 @@ class Label(LabelBase):
         max_characters: Optional[int] = None,
         animate_time: float = 0.3,
         current_index: int = 0,
+        capacity: Optional[Union[Tuple[int, int], int]] = None,
+        scroll_mode: int = SCROLL_CHARACTERS,
+        scroll_speed: Optional[float] = None,
+        bitmap_pool: Optional[BitmapPool] = None,
+        clock: Optional[Callable[[], int]] = None,
+        catch_up: Optional[int] = None,
+        accent_slots: int = 0,
+        coalesce: bool = False,
+        double_buffer: bool = False,
         **kwargs,
     ) -> None:
+        if scroll_mode not in {Label.SCROLL_CHARACTERS, Label.SCROLL_STRIP, Label.SCROLL_RING}:
+            raise ValueError(
+                "scroll_mode must be one of: SCROLL_CHARACTERS, SCROLL_STRIP, SCROLL_RING"
+            )
+        if scroll_speed is not None and scroll_mode == Label.SCROLL_CHARACTERS:
+            raise ValueError("scroll_speed requires scroll_mode SCROLL_STRIP or SCROLL_RING")
+        if scroll_speed is not None and kwargs.get("label_direction") == "RTL":
+            raise ValueError("scroll_speed is not supported with the RTL label_direction")
+        self._scroll_mode = scroll_mode
+        self._scroll_speed = scroll_speed
+        # strip and ring scrolling state, see _render_strip() and _render_ring()
+        self._scroll_rendered = False
+        self._strip_window = None
+        self._strip_positions = None
+        self._strip_period = 0
+        self._strip_offset = 0
+        self._strip_position = 0.0
+        self._ring_next = None
+        self._ring_frontier = 0
+        self._ring_claimed = 0
+        self._ring_index_x = 0
+        self._ring_y = 0
+        self._ring_lead = 0
+        self._ring_scratch = None
+        self._capacity = capacity
+        self._bitmap_pool = bitmap_pool
+        self._clock = adafruit_ticks.ticks_ms if clock is None else clock
+        self._catch_up = catch_up
         self._bitmap = None
         self._tilegrid = None
         self._prev_label_direction = None
+        self._layout_key = None
+        self._layout = None
+        self._rendered_text = None
+        self._rendered_accents = None
+        self._render_key = None
+        # the Bitmap the next frame is drawn into when double_buffer is on, and what it holds
+        self._double_buffer = double_buffer
+        self._back_bitmap = None
+        self._back_text = None
+        self._back_accents = None
+        self._back_key = None
+        # _DIRTY_* flags of the changes waiting for _reset_text()
+        self._dirty = 0
+        self._coalesce = coalesce
+        # (x1, y1, x2, y2) of the TileGrid pixels that changed since the last
+        # export.export_rgb565(), or None
+        self._damage = None
+        # the same since the last clear_dirty_rect()
+        self._changed = None
+        # _display_state() at the last clear_dirty_rect(), or None
+        self._clean = None
+        # the colors of the pixels at the last export.export_rgb565(), as bytes
+        self._export_colors = None
 
         if outline_color is not None:
             if "padding_top" not in kwargs:
@@ -174,12 +393,14 @@ class Label(LabelBase):
                     "color_palette argument can be omitted if not "
                     "using accents."
                 )
+            if len(color_palette) < 3 + accent_slots * 2:
+                raise ValueError("color_palette is too small for accent_slots")
             self._palette = color_palette
         else:
             _background_color = self._palette[0]
             _foreground_color = self._palette[1]
             _background_is_transparent = self._palette.is_transparent(0)
-            self._palette = displayio.Palette(3)
+            self._palette = displayio.Palette(3 + accent_slots * 2)
             self._palette[0] = _background_color
             self._palette[1] = _foreground_color
             self._palette[2] = outline_color if outline_color is not None else 0x999999
@@ -188,7 +409,13 @@ class Label(LabelBase):
 
         # accent handling vars
         self._accent_ranges = []
-        self._tmp_glyph_bitmap = None
+        self._accent_map = None
+        self._accent_map_text = None
+        self._accent_batch_depth = 0
+        # palette indexes of the foreground and background colors of the accent slots
+        self._accent_slots = range(len(self._palette) - accent_slots * 2, len(self._palette), 2)
+        # accent slots whose colors were set by add_accent_color_range()
+        self._allocated_slots = set()
 
         # outline handling vars
         self._outline_size = outline_size
@@ -226,6 +453,15 @@ class Label(LabelBase):
             self._font = font
         if line_spacing is not None:
             self._line_spacing = line_spacing
+        self._dirty = 0
+
+        if self._ring_next is not None:
+            # the ring buffer marquee renders the characters itself, start it over
+            self._scroll_rendered = False
+            self.update(True)
+            if scale is not None:
+                self.scale = scale
+            return
 
         # if text is not provided as a parameter (text is None), use the previous value.
         if (text is None) and self._save_text:
@@ -251,118 +487,74 @@ class Label(LabelBase):
             for _ in self._local_group:
                 self._local_group.pop(0)
 
-            # Free the bitmap and tilegrid since they are removed
-            self._bitmap = None
-            self._tilegrid = None
+            if self._capacity is None:
+                # Free the bitmap and tilegrid since they are removed
+                self._release_bitmap()
+                self._tilegrid = None
+            else:
+                # Keep them around to show the next text
+                self._rendered_text = None
+            self._add_damage()
 
         else:  # The text string is not empty, so create the Bitmap and TileGrid and
             # append to the self Group
 
-            # Calculate the text bounding box
-
-            # Calculate both "tight" and "loose" bounding box dimensions to match label for
-            # anchor_position calculations
             (
-                box_x,
+                tight_box_x,
                 tight_box_y,
                 x_offset,
-                tight_y_offset,
-                loose_box_y,
-                loose_y_offset,
-            ) = self._text_bounding_box(
-                text,
-                self._font,
-            )  # calculate the box size for a tight and loose backgrounds
-
-            if self._background_tight:
-                box_y = tight_box_y
-                y_offset = tight_y_offset
-                self._padding_left = 0
-                self._padding_right = 0
-                self._padding_top = 0
-                self._padding_bottom = 0
-
-            else:  # calculate the box size for a loose background
-                box_y = loose_box_y
-                y_offset = loose_y_offset
-
-            # Calculate the background size including padding
-            tight_box_x = box_x
-            box_x = box_x + self._padding_left + self._padding_right
-            box_y = box_y + self._padding_top + self._padding_bottom
-
-            if self._outline_color is not None:
-                box_x += self._outline_size * 2
-                box_y += self._outline_size * 2
+                y_offset,
+                bitmap_x,
+                bitmap_y,
+                placed_text,
+                placed_accents,
+                render_key,
+                x_start,
+                y_start,
+            ) = self._layout_frame(text)
 
             # Create the Bitmap unless it can be reused
             new_bitmap = None
-            if self._bitmap is None or self._bitmap.width != box_x or self._bitmap.height != box_y:
-                new_bitmap = displayio.Bitmap(box_x, box_y, len(self._palette))
+            x_range = None
+            if (
+                self._bitmap is None
+                or self._bitmap.width != bitmap_x
+                or self._bitmap.height != bitmap_y
+            ):
+                self._release_bitmap()
+                new_bitmap = self._acquire_bitmap(bitmap_x, bitmap_y)
                 self._bitmap = new_bitmap
+                self._place_text(new_bitmap, placed_text, self._font, x_start, y_start)
             else:
-                self._bitmap.fill(0)
-
-            # Place the text into the Bitmap
-            self._place_text(
-                self._bitmap,
-                text if self._label_direction != "RTL" else "".join(reversed(text)),
-                self._font,
-                self._padding_left - x_offset,
-                self._padding_top + y_offset,
-            )
-
-            if self._base_alignment:
-                label_position_yoffset = 0
-            else:
-                label_position_yoffset = self._ascent // 2
-
-            # Create the TileGrid if not created bitmap unchanged
-            if self._tilegrid is None or new_bitmap:
-                self._tilegrid = displayio.TileGrid(
-                    self._bitmap,
-                    pixel_shader=self._palette,
-                    width=1,
-                    height=1,
-                    tile_width=box_x,
-                    tile_height=box_y,
-                    default_tile=0,
-                    x=-self._padding_left + x_offset,
-                    y=label_position_yoffset - y_offset - self._padding_top,
-                )
-                # Clear out any items in the local_group Group, in case this is an update to
-                # the bitmap_label
-                for _ in self._local_group:
-                    self._local_group.pop(0)
-                self._local_group.append(self._tilegrid)  # add the bitmap's tilegrid to the group
-
-            # Set TileGrid properties based on label_direction
-            if self._label_direction != self._prev_label_direction:
-                tg1 = self._tilegrid
-                tg1.transpose_xy, tg1.flip_x, tg1.flip_y = self._DIR_MAP[self._label_direction]
-
-            # Update bounding_box values.  Note: To be consistent with label.py,
-            # this is the bounding box for the text only, not including the background.
-            if self._label_direction in {"UPR", "DWR"}:
-                if self._label_direction == "UPR":
-                    top = self._padding_right
-                    left = self._padding_top
-                if self._label_direction == "DWR":
-                    top = self._padding_left
-                    left = self._padding_bottom
-                self._bounding_box = (
-                    self._tilegrid.x + left,
-                    self._tilegrid.y + top,
-                    tight_box_y,
-                    tight_box_x,
-                )
-            else:
-                self._bounding_box = (
-                    self._tilegrid.x + self._padding_left,
-                    self._tilegrid.y + self._padding_top,
-                    tight_box_x,
-                    tight_box_y,
-                )
+                if render_key == self._render_key:
+                    x_range = self._changed_columns(
+                        self._rendered_text,
+                        placed_text,
+                        x_start,
+                        self._rendered_accents,
+                        placed_accents,
+                    )
+                if self._double_buffer:
+                    # draw into the back Bitmap, which may hold this frame already from
+                    # render_ahead(), and show it only once it is complete
+                    self._render_back(placed_text, placed_accents, render_key, x_start, y_start)
+                    self._show_back()
+                else:
+                    # Place the text into the Bitmap, or only the changed columns of it
+                    self._draw_text(self._bitmap, x_range, placed_text, x_start, y_start)
+            self._rendered_text = placed_text
+            self._rendered_accents = placed_accents
+            self._render_key = render_key
+            if new_bitmap is not None or x_range is None or self._strip_window is not None:
+                self._add_damage()
+            elif x_range[0] < x_range[1]:
+                self._add_damage(x_range[0], 0, x_range[1])
+
+            # When scrolling a strip the TileGrid shows a window of one pixel wide columns
+            if self._strip_window is not None:
+                tight_box_x = self._strip_window[1]
+            self._update_tilegrid(new_bitmap is not None, x_offset, y_offset)
+            self._update_bounding_box(tight_box_x, tight_box_y)
 
         if (
             scale is not None
@@ -373,6 +565,388 @@ class Label(LabelBase):
         # x,y positions of the label
         self.anchored_position = self._anchored_position
 
+    def _update_tilegrid(self, new_bitmap: bool, x_offset: int, y_offset: int) -> None:
+        # Create the TileGrid that shows self._bitmap, or move the existing one
+        if self._base_alignment:
+            label_position_yoffset = 0
+        else:
+            label_position_yoffset = self._ascent // 2
+
+        tile_columns = 1 if self._strip_window is None else self._strip_window[0]
+
+        # Create the TileGrid if not created bitmap unchanged
+        if self._tilegrid is None or new_bitmap or self._tilegrid.width != tile_columns:
+            self._tilegrid = displayio.TileGrid(
+                self._bitmap,
+                pixel_shader=self._palette,
+                width=tile_columns,
+                height=1,
+                tile_width=self._bitmap.width if tile_columns == 1 else 1,
+                tile_height=self._bitmap.height,
+                default_tile=0,
+                x=-self._padding_left + x_offset,
+                y=label_position_yoffset - y_offset - self._padding_top,
+            )
+            if self._strip_window is not None:
+                self._scroll_strip(self._strip_offset)
+            # Clear out any items in the local_group Group, in case this is an update to
+            # the bitmap_label
+            for _ in self._local_group:
+                self._local_group.pop(0)
+            self._local_group.append(self._tilegrid)  # add the bitmap's tilegrid to the group
+        else:
+            self._tilegrid.x = -self._padding_left + x_offset
+            self._tilegrid.y = label_position_yoffset - y_offset - self._padding_top
+            if len(self._local_group) == 0:  # removed while the text was empty
+                self._local_group.append(self._tilegrid)
+
+        # Set TileGrid properties based on label_direction
+        if self._label_direction != self._prev_label_direction:
+            tg1 = self._tilegrid
+            direction = self._DIR_MAP[self._label_direction]
+            if (tg1.transpose_xy, tg1.flip_x, tg1.flip_y) != direction:
+                tg1.transpose_xy, tg1.flip_x, tg1.flip_y = direction
+                self._add_damage()
+
+    def _update_bounding_box(self, tight_box_x: int, tight_box_y: int) -> None:
+        # Update bounding_box values.  Note: To be consistent with label.py,
+        # this is the bounding box for the text only, not including the background.
+        if self._label_direction in {"UPR", "DWR"}:
+            if self._label_direction == "UPR":
+                top = self._padding_right
+                left = self._padding_top
+            if self._label_direction == "DWR":
+                top = self._padding_left
+                left = self._padding_bottom
+            self._bounding_box = (
+                self._tilegrid.x + left,
+                self._tilegrid.y + top,
+                tight_box_y,
+                tight_box_x,
+            )
+        else:
+            self._bounding_box = (
+                self._tilegrid.x + self._padding_left,
+                self._tilegrid.y + self._padding_top,
+                tight_box_x,
+                tight_box_y,
+            )
+
+    def _layout_frame(self, text: str) -> Tuple:
+        # Lay out a non-empty text the way _reset_text() draws it. Returns the tight box
+        # width and height, the x and y offsets, the Bitmap width and height, the text and
+        # its accents in drawing order, the render key and the start position of the text.
+
+        # Calculate both "tight" and "loose" bounding box dimensions to match label for
+        # anchor_position calculations, reusing the cached layout if it is still valid
+        (
+            box_x,
+            tight_box_y,
+            x_offset,
+            tight_y_offset,
+            loose_box_y,
+            loose_y_offset,
+        ) = self._get_text_layout(text)
+
+        if self._background_tight:
+            box_y = tight_box_y
+            y_offset = tight_y_offset
+            self._padding_left = 0
+            self._padding_right = 0
+            self._padding_top = 0
+            self._padding_bottom = 0
+
+        else:  # calculate the box size for a loose background
+            box_y = loose_box_y
+            y_offset = loose_y_offset
+
+        # Calculate the background size including padding
+        tight_box_x = box_x
+        box_x = box_x + self._padding_left + self._padding_right
+        box_y = box_y + self._padding_top + self._padding_bottom
+
+        if self._outline_color is not None:
+            box_x += self._outline_size * 2
+            box_y += self._outline_size * 2
+
+        placed_text = text if self._label_direction != "RTL" else "".join(reversed(text))
+        x_start = self._padding_left - x_offset
+        y_start = self._padding_top + y_offset
+
+        # everything other than the text and its accents that determines the bitmap contents
+        render_key = (
+            self._font,
+            self._line_spacing,
+            self._outline_size,
+            self._outline_color is None,
+            self._has_outline_accent(),
+            x_start,
+            y_start,
+        )
+        bitmap_x, bitmap_y = self._bitmap_size(box_x, box_y)
+        return (
+            tight_box_x,
+            tight_box_y,
+            x_offset,
+            y_offset,
+            bitmap_x,
+            bitmap_y,
+            placed_text,
+            self._text_accents(placed_text),
+            render_key,
+            x_start,
+            y_start,
+        )
+
+    def _get_text_layout(self, text: str) -> Tuple[int, int, int, int, int, int]:
+        # The layout only depends on the text, the font, the line spacing and the outline
+        # accents (which widen the characters they cover). Colors, foreground_background
+        # accents and label_direction do not move any glyph, so changing them reuses the
+        # last computed layout and only the blit pass is repeated.
+        outlined = ()
+        if self._has_outline_accent():
+            # the characters that end up outlined, only the first range covering a
+            # character applies so the ranges alone do not tell
+            accent_map = self._get_accent_map()
+            outlined = tuple(
+                index
+                for index in range(min(len(text), len(accent_map)))
+                if accent_map[index]
+                and self._accent_ranges[accent_map[index] - 1][ACCENT_TYPE] == "outline"
+            )
+        layout_key = (text, self._font, self._line_spacing, self._outline_size, outlined)
+        if layout_key != self._layout_key:
+            self._layout = self._text_bounding_box(text, self._font)
+            self._layout_key = layout_key
+        return self._layout
+
+    def _add_damage(
+        self, x1: int = 0, y1: int = 0, x2: int = _DAMAGE_EDGE, y2: int = _DAMAGE_EDGE
+    ) -> None:
+        # Record that the pixels of this rectangle of the TileGrid changed, by default all
+        area = (x1, y1, x2, y2)
+        self._damage = _union_area(self._damage, area)
+        self._changed = _union_area(self._changed, area)
+
+    def _shown_area(
+        self, x1: int, y1: int, x2: int, y2: int
+    ) -> Optional[Tuple[int, int, int, int]]:
+        # Where the pixels of this rectangle of the TileGrid are shown once label_direction
+        # is applied, as (x1, y1, x2, y2) in pixels of the TileGrid, or None if none are
+        tilegrid = self._tilegrid
+        width = tilegrid.width * tilegrid.tile_width
+        height = tilegrid.tile_height
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, width), min(y2, height)
+        if x1 >= x2 or y1 >= y2:
+            return None
+        if tilegrid.flip_x:
+            x1, x2 = width - x2, width - x1
+        if tilegrid.flip_y:
+            y1, y2 = height - y2, height - y1
+        if tilegrid.transpose_xy:
+            return y1, x1, y2, x2
+        return x1, y1, x2, y2
+
+    def _display_area(
+        self, area: Optional[Tuple[int, int, int, int]]
+    ) -> Optional[Tuple[int, int, int, int]]:
+        # An area returned by _shown_area() in display coordinates
+        if area is None:
+            return None
+        scale = self._local_group.scale
+        x = self.x + self._tilegrid.x * scale
+        y = self.y + self._tilegrid.y * scale
+        return x + area[0] * scale, y + area[1] * scale, x + area[2] * scale, y + area[3] * scale
+
+    def _display_state(self) -> Tuple:
+        # The area the label shows on the display, or None, and the colors of its palette
+        shown = None
+        if self._tilegrid is not None and len(self._local_group) != 0:
+            shown = self._display_area(self._shown_area(0, 0, _DAMAGE_EDGE, _DAMAGE_EDGE))
+        palette = self._palette
+        colors = tuple(
+            (palette[index], palette.is_transparent(index)) for index in range(len(palette))
+        )
+        return shown, colors
+
+    def _acquire_bitmap(self, width: int, height: int) -> displayio.Bitmap:
+        if self._bitmap_pool is None:
+            return displayio.Bitmap(width, height, len(self._palette))
+        return self._bitmap_pool.acquire(width, height, len(self._palette))
+
+    def _release_bitmap(self) -> None:
+        if self._bitmap is not None and self._bitmap_pool is not None:
+            self._bitmap_pool.release(self._bitmap, len(self._palette))
+        self._bitmap = None
+        self._rendered_text = None
+        self._release_back()
+
+    def _release_back(self) -> None:
+        if self._back_bitmap is not None and self._bitmap_pool is not None:
+            self._bitmap_pool.release(self._back_bitmap, len(self._palette))
+        self._back_bitmap = None
+        self._back_text = None
+
+    def _draw_text(
+        self,
+        bitmap: displayio.Bitmap,
+        x_range: Optional[Tuple[int, int]],
+        text: str,
+        x_start: int,
+        y_start: int,
+    ) -> None:
+        # Clear the x_range columns of the bitmap, or all of it when x_range is None, and
+        # place the text into them
+        if x_range is None:
+            bitmap.fill(0)
+        elif x_range[0] < x_range[1]:
+            _fill_region(bitmap, x_range[0], 0, x_range[1], bitmap.height, 0)
+        else:
+            return
+        self._place_text(bitmap, text, self._font, x_start, y_start, x_range=x_range)
+
+    def _render_back(
+        self, text: str, accents: Optional[list], render_key: tuple, x_start: int, y_start: int
+    ) -> None:
+        # Draw a frame into the back Bitmap, which has the size of the shown one. Only the
+        # columns that differ from the frame it holds are drawn again.
+        width, height = self._bitmap.width, self._bitmap.height
+        back = self._back_bitmap
+        if back is None or back.width != width or back.height != height:
+            self._release_back()
+            back = self._back_bitmap = self._acquire_bitmap(width, height)
+        x_range = None
+        if render_key == self._back_key:
+            x_range = self._changed_columns(
+                self._back_text, text, x_start, self._back_accents, accents
+            )
+        self._draw_text(back, x_range, text, x_start, y_start)
+        self._back_text = text
+        self._back_accents = accents
+        self._back_key = render_key
+
+    def _show_back(self) -> None:
+        # Swap the back Bitmap with the shown one, which becomes the next back Bitmap
+        self._bitmap, self._back_bitmap = self._back_bitmap, self._bitmap
+        self._rendered_text, self._back_text = self._back_text, self._rendered_text
+        self._rendered_accents, self._back_accents = self._back_accents, self._rendered_accents
+        self._render_key, self._back_key = self._back_key, self._render_key
+        if self._tilegrid is not None:
+            self._tilegrid.bitmap = self._bitmap
+
+    def _bitmap_size(self, box_x: int, box_y: int) -> Tuple[int, int]:
+        # Size of the Bitmap to render a box_x by box_y background box into
+        if self._capacity is None or self._strip_window is not None:
+            return box_x, box_y
+        if self._capacity == Label.CAPACITY_AUTO:
+            # round up to the next size class and only ever grow
+            bitmap_x = -(-box_x // _CAPACITY_STEP) * _CAPACITY_STEP
+            bitmap_y = -(-box_y // _CAPACITY_STEP) * _CAPACITY_STEP
+            if self._bitmap is not None:
+                bitmap_x = max(bitmap_x, self._bitmap.width)
+                bitmap_y = max(bitmap_y, self._bitmap.height)
+            return bitmap_x, bitmap_y
+        return self._capacity
+
+    def _text_accents(self, text: str) -> Optional[list]:
+        # The accent range that applies to each character of text when _place_text draws
+        # it, or None if the label has no accents
+        if not self._accent_ranges:
+            return None
+        accent_map = self._get_accent_map()
+        accent_offset = self.current_index if self._strip_window is None else 0
+        text_length = len(self._full_text)
+        accents = []
+        for char_idx in range(len(text)):
+            accent_slot = accent_map[(accent_offset + char_idx) % text_length]
+            accents.append(self._accent_ranges[accent_slot - 1] if accent_slot else None)
+        return accents
+
+    def _changed_columns(
+        self,
+        old_text: Optional[str],
+        new_text: str,
+        x_start: int,
+        old_accents: Optional[list] = None,
+        new_accents: Optional[list] = None,
+    ) -> Optional[Tuple[int, int]]:
+        # Compare against the previously rendered text and accents and return the
+        # (start, end) range of bitmap columns that needs to be cleared and drawn again,
+        # including the outline around the changed glyphs. Returns None when the whole
+        # bitmap must be redrawn.
+        if old_text is None or "\n" in old_text or "\n" in new_text:
+            return None
+        old_accents = old_accents or [None] * len(old_text)
+        new_accents = new_accents or [None] * len(new_text)
+
+        shortest = min(len(old_text), len(new_text))
+        prefix = 0
+        while (
+            prefix < shortest
+            and old_text[prefix] == new_text[prefix]
+            and old_accents[prefix] == new_accents[prefix]
+        ):
+            prefix += 1
+        if prefix == len(old_text) == len(new_text):
+            return 0, 0  # nothing changed
+        suffix = 0
+        while (
+            suffix < shortest - prefix
+            and old_text[-1 - suffix] == new_text[-1 - suffix]
+            and old_accents[-1 - suffix] == new_accents[-1 - suffix]
+        ):
+            suffix += 1
+
+        glyphs_of = self._accented_glyphs
+        xposition = sum(glyph[2] for glyph in glyphs_of(new_text, new_accents, 0, prefix))
+
+        # The glyphs of the unchanged suffix only stay in place if the changed
+        # middle section has the same total advance in both strings.
+        changed = [
+            glyphs_of(old_text, old_accents, prefix, len(old_text) - suffix),
+            glyphs_of(new_text, new_accents, prefix, len(new_text) - suffix),
+        ]
+        if sum(glyph[2] for glyph in changed[0]) != sum(glyph[2] for glyph in changed[1]):
+            changed = [
+                glyphs_of(old_text, old_accents, prefix, len(old_text)),
+                glyphs_of(new_text, new_accents, prefix, len(new_text)),
+            ]
+
+        left = right = None
+        for glyphs in changed:
+            glyph_x = x_start + xposition
+            for my_glyph, accent, advance in glyphs:
+                if my_glyph is not None:
+                    glyph_left = max(glyph_x + my_glyph.dx, 0)
+                    # accented glyphs are drawn with a margin for the outline or background
+                    width = my_glyph.width
+                    if accent is not None:
+                        width += self._outline_size * 2
+                    if width:
+                        left = glyph_left if left is None else min(left, glyph_left)
+                        right = max(right or 0, glyph_left + width)
+                glyph_x += advance
+        if left is None:
+            return 0, 0  # only blank glyphs changed
+
+        if self._outline_color is not None:
+            left -= self._outline_size
+            right += self._outline_size
+        return max(left, 0), min(right, self._bitmap.width)
+
+    def _accented_glyphs(self, text: str, accents: list, start: int, end: int) -> list:
+        # (glyph, accent, advance) of the characters of text from start to end
+        glyphs = []
+        for index in range(start, end):
+            my_glyph = self._font.get_glyph(ord(text[index]))
+            accent = accents[index]
+            advance = 0 if my_glyph is None else my_glyph.shift_x
+            if accent is not None and accent[ACCENT_TYPE] == "outline":
+                advance += self._outline_size  # outline accents widen the character
+            glyphs.append((my_glyph, accent, advance))
+        return glyphs
+
     @staticmethod
     def _line_spacing_ypixels(font: FontProtocol, line_spacing: float) -> int:
         # Note: Scaling is provided at the Group level
@@ -401,6 +975,7 @@ class Label(LabelBase):
 
         newlines = 0
         line_spacing = self._line_spacing
+        outline_map = self._get_accent_map() if self._has_outline_accent() else ()
 
         for char_index in range(len(text)):
             char = text[char_index]
@@ -428,10 +1003,10 @@ class Label(LabelBase):
                     xright = xposition + my_glyph.width + my_glyph.dx
                     xposition += my_glyph.shift_x
 
-                    for accent in self.accent_ranges:
+                    if char_index < len(outline_map) and outline_map[char_index]:
+                        accent = self._accent_ranges[outline_map[char_index] - 1]
                         if accent[ACCENT_TYPE] == "outline":
-                            if accent[ACCENT_START] <= char_index < accent[ACCENT_END]:
-                                xposition += self.outline_size
+                            xposition += self.outline_size
 
                     right = max(right, xposition, xright)
 
@@ -473,6 +1048,8 @@ class Label(LabelBase):
         skip_index: int = 0,  # set to None to write all pixels, other wise skip this palette index
         # when copying glyph bitmaps (this is important for slanted text
         # where rectangular glyph boxes overlap)
+        x_range: Optional[Tuple[int, int]] = None,  # only draw into these bitmap columns
+        accent_offset: Optional[int] = None,  # index of text[0] within full_text for accents
     ) -> Tuple[int, int, int, int]:
         # placeText - Writes text into a bitmap at the specified location.
         #
@@ -485,6 +1062,19 @@ class Label(LabelBase):
         right = x_start
         top = bottom = y_start
         line_spacing = self._line_spacing
+        if accent_offset is None:
+            # a scrolling strip always starts at the first character of the full text
+            accent_offset = self.current_index if self._strip_window is None else 0
+        accent_map = self._get_accent_map() if self._accent_ranges else None
+        has_outline_accent = self._has_outline_accent()
+        margin = self._outline_size * 2
+        scratch = None
+        if accent_map is not None:
+            # big enough for any glyph of the font, with the outline around it
+            font_box = font.get_bounding_box()
+            scratch = _scratch_bitmap(
+                font_box[0] + margin, font_box[1] + margin, len(self._palette)
+            )
 
         for char_idx in range(len(text)):
             char = text[char_idx]
@@ -494,12 +1084,6 @@ class Label(LabelBase):
 
             else:
                 my_glyph = font.get_glyph(ord(char))
-                if self._tmp_glyph_bitmap is None and len(self._accent_ranges) > 0:
-                    self._tmp_glyph_bitmap = displayio.Bitmap(
-                        my_glyph.width + self.outline_size * 2,
-                        my_glyph.height + self.outline_size * 2,
-                        len(self._palette),
-                    )
 
                 if my_glyph is None:  # Error checking: no glyph found
                     print(f"Glyph not found: {repr(char)}")
@@ -541,72 +1125,94 @@ class Label(LabelBase):
 
                     accented = False
                     accent_type = "foreground_background"
-                    if len(self._accent_ranges) > 0:
-                        for accent_range in self._accent_ranges:
-                            if (
-                                accent_range[ACCENT_START]
-                                <= (self.current_index + char_idx) % len(self._full_text)
-                                < accent_range[ACCENT_END]
-                            ):
-                                accent_type = accent_range[ACCENT_TYPE]
-                                if accent_range[ACCENT_TYPE] == "foreground_background":
-                                    self._tmp_glyph_bitmap.fill(accent_range[ACCENT_BG])
-
-                                    bitmaptools.blit(
-                                        self._tmp_glyph_bitmap,
-                                        my_glyph.bitmap,
-                                        0,
-                                        0,
-                                        x1=glyph_offset_x,
-                                        y1=y_clip,
-                                        x2=glyph_offset_x + my_glyph.width,
-                                        y2=my_glyph.height,
-                                        skip_source_index=0,
-                                    )
-                                    bitmaptools.replace_color(
-                                        self._tmp_glyph_bitmap, 1, accent_range[ACCENT_FG]
-                                    )
-                                    accented = True
-                                elif accent_range[ACCENT_TYPE] == "outline":
-                                    self._tmp_glyph_bitmap.fill(0)
-                                    bitmaptools.blit(
-                                        self._tmp_glyph_bitmap,
-                                        my_glyph.bitmap,
-                                        self._outline_size,
-                                        self._outline_size,
-                                        x1=glyph_offset_x,
-                                        y1=y_clip,
-                                        x2=glyph_offset_x + my_glyph.width,
-                                        y2=my_glyph.height,
-                                        skip_source_index=0,
-                                    )
-                                    self._add_outline(self._tmp_glyph_bitmap)
-                                    bitmaptools.replace_color(
-                                        self._tmp_glyph_bitmap, 1, accent_range[ACCENT_FG]
-                                    )
-                                    bitmaptools.replace_color(
-                                        self._tmp_glyph_bitmap, 2, accent_range[ACCENT_BG]
-                                    )
-                                    accented = True
-
-                                # only one accent range can effect a given character
-                                break
+                    accent_slot = 0
+                    if accent_map is not None:
+                        accent_slot = accent_map[(accent_offset + char_idx) % len(self._full_text)]
+                    if accent_slot:
+                        accent_range = self._accent_ranges[accent_slot - 1]
+                        accent_type = accent_range[ACCENT_TYPE]
+                        # the glyph is drawn from the top left corner of the scratch Bitmap
+                        scratch_width = my_glyph.width + margin
+                        scratch_height = my_glyph.height + margin
+                        if scratch_width > scratch.width or scratch_height > scratch.height:
+                            # the font bounding box does not cover this glyph
+                            scratch = _scratch_bitmap(
+                                max(scratch_width, scratch.width),
+                                max(scratch_height, scratch.height),
+                                len(self._palette),
+                            )
+                        if accent_range[ACCENT_TYPE] == "foreground_background":
+                            bitmaptools.fill_region(
+                                scratch,
+                                0,
+                                0,
+                                scratch_width,
+                                scratch_height,
+                                accent_range[ACCENT_BG],
+                            )
+
+                            bitmaptools.blit(
+                                scratch,
+                                my_glyph.bitmap,
+                                0,
+                                0,
+                                x1=glyph_offset_x,
+                                y1=y_clip,
+                                x2=glyph_offset_x + my_glyph.width,
+                                y2=my_glyph.height,
+                                skip_source_index=0,
+                            )
+                            bitmaptools.replace_color(scratch, 1, accent_range[ACCENT_FG])
+                            accented = True
+                        elif accent_range[ACCENT_TYPE] == "outline":
+                            scratch.fill(0)  # the outline is drawn around everything in it
+                            bitmaptools.blit(
+                                scratch,
+                                my_glyph.bitmap,
+                                self._outline_size,
+                                self._outline_size,
+                                x1=glyph_offset_x,
+                                y1=y_clip,
+                                x2=glyph_offset_x + my_glyph.width,
+                                y2=my_glyph.height,
+                                skip_source_index=0,
+                            )
+                            self._add_outline(scratch)
+                            bitmaptools.replace_color(scratch, 1, accent_range[ACCENT_FG])
+                            bitmaptools.replace_color(scratch, 2, accent_range[ACCENT_BG])
+                            accented = True
 
                     if (
                         not accented
-                        and self._has_outline_accent()
+                        and has_outline_accent
                         or accented
                         and accent_type == "foreground_background"
                     ):
                         y_blit_target += self._outline_size
 
-                    if accented:
+                    x_blit_target = max(xposition + my_glyph.dx, 0)
+                    x_1 = glyph_offset_x if not accented else 0
+                    x_2 = glyph_offset_x + my_glyph.width if not accented else scratch_width
+                    if x_range is not None:
+                        # only draw the part of the glyph that falls inside x_range
+                        if x_blit_target < x_range[0]:
+                            x_1 += x_range[0] - x_blit_target
+                            x_blit_target = x_range[0]
+                        x_2 = min(x_2, x_1 + x_range[1] - x_blit_target)
+
+                    if x_1 >= x_2:  # nothing of this glyph is inside x_range
+                        pass
+                    elif accented:
                         try:
                             bitmaptools.blit(
                                 bitmap,
-                                self._tmp_glyph_bitmap,
-                                max(xposition + my_glyph.dx, 0),
+                                scratch,
+                                x_blit_target,
                                 y_blit_target,
+                                x1=x_1,
+                                y1=0,
+                                x2=x_2,
+                                y2=scratch_height,
                             )
                         except ValueError:
                             # It's possible to overshoot the width of the bitmap if max_characters
@@ -618,16 +1224,14 @@ class Label(LabelBase):
                         try:
                             self._blit(
                                 bitmap,
-                                max(xposition + my_glyph.dx, 0),
+                                x_blit_target,
                                 y_blit_target,
-                                my_glyph.bitmap if not accented else self._tmp_glyph_bitmap,
-                                x_1=glyph_offset_x,
+                                my_glyph.bitmap,
+                                x_1=x_1,
                                 y_1=y_clip,
-                                x_2=glyph_offset_x + my_glyph.width,
+                                x_2=x_2,
                                 y_2=my_glyph.height,
-                                skip_index=skip_index
-                                if not accented
-                                else None,  # do not copy any 0 background pixels if not accented
+                                skip_index=skip_index,  # do not copy any 0 background pixels
                             )
                         except ValueError:
                             # It's possible to overshoot the width of the bitmap if max_characters
@@ -641,20 +1245,31 @@ class Label(LabelBase):
                     else:
                         xposition += my_glyph.shift_x
 
-        self._add_outline(self.bitmap)
+        if bitmap is self._bitmap or bitmap is self._back_bitmap:
+            self._add_outline(bitmap, x_range)
         # bounding_box
         return left, top, right - left, bottom - top
 
-    def _add_outline(self, bitmap):
+    def _add_outline(self, bitmap, x_range=None):
         """
         Blit the outline into the labels Bitmap. Will blit self._stamp_source for each
         pixel of the foreground color but skip the foreground color when we blit,
         creating an outline.
+        :param x_range: Optional (start, end) range of columns that need their outline
+          redrawn. Foreground pixels within ``outline_size`` of the range are stamped.
         :return: None
         """
-        if bitmap is not self.bitmap or self._outline_color is not None:
+        label_bitmap = bitmap is self._bitmap or bitmap is self._back_bitmap
+        if not label_bitmap or self._outline_color is not None:
+            x_first, x_last = 0, bitmap.width
+            if x_range is not None:
+                x_first = max(x_range[0] - self._outline_size, 0)
+                x_last = min(x_range[1] + self._outline_size, bitmap.width)
+            if hasattr(bitmaptools, "dilate"):
+                bitmaptools.dilate(bitmap, self._outline_size, 1, 2, x1=x_first, x2=x_last)
+                return
             for y in range(bitmap.height):
-                for x in range(bitmap.width):
+                for x in range(x_first, x_last):
                     if bitmap[x, y] == 1:
                         try:
                             bitmaptools.blit(
@@ -671,6 +1286,27 @@ class Label(LabelBase):
                                 "Try using either larger padding sizes, or smaller outline_size."
                             ) from value_error
 
+    def _get_accent_map(self) -> Union[bytearray, List[int]]:
+        # For each character of full_text, one more than the index in accent_ranges of the
+        # accent that applies to it, or 0. Only the first range containing a character
+        # applies to it. Rebuilt when the accents or the text change.
+        if self._accent_map is None or self._accent_map_text is not self._full_text:
+            text_length = len(self._full_text)
+            if len(self._accent_ranges) < 256:
+                accent_map = bytearray(text_length)
+            else:
+                accent_map = [0] * text_length
+            # fill in reverse so that earlier ranges overwrite later ones
+            for slot in range(len(self._accent_ranges), 0, -1):
+                accent_range = self._accent_ranges[slot - 1]
+                start = max(accent_range[ACCENT_START], 0)
+                end = min(accent_range[ACCENT_END], text_length)
+                for index in range(start, end):
+                    accent_map[index] = slot
+            self._accent_map = accent_map
+            self._accent_map_text = self._full_text
+        return self._accent_map
+
     def _has_outline_accent(self):
         for accent in self._accent_ranges:
             if accent[ACCENT_TYPE] == "outline":
@@ -715,7 +1351,7 @@ class Label(LabelBase):
                 skip_source_index=skip_index,
             )
 
-        else:  # perform pixel by pixel copy of the bitmap
+        else:  # copy the bitmap row by row
             # Perform input checks
 
             if x_2 is None:
@@ -733,45 +1369,70 @@ class Label(LabelBase):
             x_2 = min(x_2, source_bitmap.width)
             y_2 = min(y_2, source_bitmap.height)
 
-            for y_count in range(y_2 - y_1):
-                for x_count in range(x_2 - x_1):
-                    x_placement = x + x_count
-                    y_placement = y + y_count
-
-                    if (bitmap.width > x_placement >= 0) and (
-                        bitmap.height > y_placement >= 0
-                    ):  # ensure placement is within target bitmap
-                        # get the palette index from the source bitmap
-                        this_pixel_color = source_bitmap[
-                            y_1
-                            + (
-                                y_count * source_bitmap.width
-                            )  # Direct index into a bitmap array is speedier than [x,y] tuple
-                            + x_1
-                            + x_count
-                        ]
+            # Clip the rectangle to the target bitmap once, instead of checking every pixel
+            if x < 0:
+                x_1 -= x
+                x = 0
+            if y < 0:
+                y_1 -= y
+                y = 0
+            width = min(x_2 - x_1, bitmap.width - x)
+            height = min(y_2 - y_1, bitmap.height - y)
+            if width <= 0 or height <= 0:
+                return
 
-                        if (skip_index is None) or (this_pixel_color != skip_index):
-                            bitmap[  # Direct index into a bitmap array is speedier than [x,y] tuple
-                                y_placement * bitmap.width + x_placement
-                            ] = this_pixel_color
-                    elif y_placement > bitmap.height:
-                        break
+            # Direct index into a bitmap array is speedier than [x,y] tuple, and a
+            # byte per pixel buffer allows copying whole rows with slices. Glyphs are never
+            # stored that way, so text is copied pixel by pixel, the slices only serve
+            # blits between 8 bit Bitmaps.
+            source_pixels = _pixel_buffer(source_bitmap) or source_bitmap
+            target_pixels = _pixel_buffer(bitmap) or bitmap
+            row_copy = source_pixels is not source_bitmap and target_pixels is not bitmap
+            if row_copy and skip_index is not None:
+                skip_byte = bytes((skip_index,))
+            for row in range(height):
+                source_start = (y_1 + row) * source_bitmap.width + x_1
+                target_start = (y + row) * bitmap.width + x
+                if row_copy:
+                    source_row = source_pixels[source_start : source_start + width]
+                    if skip_index is None:
+                        target_pixels[target_start : target_start + width] = source_row
+                        continue
+                    # copy the runs of pixels between the skipped ones with slices
+                    row_pixels = bytes(source_row)
+                    start = width - len(row_pixels.lstrip(skip_byte))
+                    while start < width:
+                        end = row_pixels.find(skip_byte, start)
+                        if end < 0:
+                            end = width
+                        target_pixels[target_start + start : target_start + end] = source_row[
+                            start:end
+                        ]
+                        start = width - len(row_pixels[end:].lstrip(skip_byte))
+                    continue
+                for column in range(width):
+                    this_pixel_color = source_pixels[source_start + column]
+                    if this_pixel_color != skip_index:
+                        target_pixels[target_start + column] = this_pixel_color
 
     def _set_line_spacing(self, new_line_spacing: float) -> None:
         if self._save_text:
-            self._reset_text(line_spacing=new_line_spacing, scale=self.scale)
+            self._line_spacing = new_line_spacing
+            if not self._deferred(_DIRTY_GEOMETRY):
+                self._reset_text(line_spacing=new_line_spacing, scale=self.scale)
         else:
             raise RuntimeError("line_spacing is immutable when save_text is False")
 
     def _set_font(self, new_font: FontProtocol) -> None:
         self._font = new_font
         if self._save_text:
-            self._reset_text(font=new_font, scale=self.scale)
+            if not self._deferred(_DIRTY_GEOMETRY):
+                self._reset_text(font=new_font, scale=self.scale)
         else:
             raise RuntimeError("font is immutable when save_text is False")
 
     def _set_text(self, new_text: str, scale: int) -> None:
+        self._dirty |= _DIRTY_TEXT
         self._reset_text(text=self._replace_tabs(new_text), scale=self.scale)
 
     def _set_background_color(self, new_color: Optional[int]):
@@ -787,13 +1448,24 @@ class Label(LabelBase):
         # Only make changes if new direction is different
         # to prevent errors in the _reset_text() direction checks
         if self._label_direction != new_label_direction:
+            if self._scroll_speed is not None and new_label_direction == "RTL":
+                raise ValueError("scroll_speed is not supported with the RTL label_direction")
             self._prev_label_direction = self._label_direction
             self._label_direction = new_label_direction
-            self._reset_text(text=str(self._text))  # Force a recalculation
+            if not self._deferred(_DIRTY_GEOMETRY):
+                self._reset_text(text=str(self._text))  # Force a recalculation
 
     def _get_valid_label_directions(self) -> Tuple[str, ...]:
         return "LTR", "RTL", "UPD", "UPR", "DWR"
 
+    def deinit(self) -> None:
+        """Remove the rendered text from the label and free its Bitmap, handing it back
+        to ``bitmap_pool`` if one is used. Setting new text renders it again."""
+        for _ in self._local_group:
+            self._local_group.pop(0)
+        self._release_bitmap()
+        self._tilegrid = None
+
     @property
     def bitmap(self) -> displayio.Bitmap:
         """
@@ -803,52 +1475,449 @@ class Label(LabelBase):
         """
         return self._bitmap
 
-    def update(self, force: bool = False) -> bool:
+    def _deferred(self, flags: int = _DIRTY_TEXT) -> bool:
+        # Record a change waiting for _reset_text(), True when coalesce leaves the render
+        # to update() or flush()
+        self._dirty |= flags
+        return self._coalesce
+
+    @property
+    def coalesce(self) -> bool:
+        """Whether changes of the text and style are only recorded, and rendered by
+        :py:meth:`update` or :py:meth:`flush`. Turning it off renders the recorded changes."""
+        return self._coalesce
+
+    @coalesce.setter
+    def coalesce(self, new_coalesce: bool) -> None:
+        self._coalesce = new_coalesce
+        if not new_coalesce:
+            self.flush()
+
+    @property
+    def pending(self) -> bool:
+        """Whether there are recorded changes that were not rendered yet."""
+        return bool(self._dirty)
+
+    def flush(self) -> bool:
+        """Render the changes recorded while ``coalesce`` is on, without waiting for
+        ``animate_time`` to elapse.
+
+        :return: bool updated: whether anything was rendered and the display needs to be refreshed.
+        """
+        if not self._dirty:
+            return False
+        updated = self._animate(self._clock(), True)
+        self._dirty = 0
+        return updated
+
+    def update(self, force: bool = False, now: Optional[int] = None) -> bool:
         """Attempt to update the display. If ``animate_time`` has elapsed since
         previews animation frame then move the characters over by 1 index.
         Must be called in the main loop of user code.
 
         :param bool force: whether to ignore ``animation_time`` and force the update.
          Default is False.
+        :param Optional[int] now: The current time in the form of ``adafruit_ticks.ticks_ms()``.
+         Default is None, read the ``clock`` of the label.
         :return: bool updated: whether anything changed and the display needs to be refreshed.
         """
-        _now = adafruit_ticks.ticks_ms()
-        if force or adafruit_ticks.ticks_less(
-            self._last_animate_time + int(self.animate_time * 1000), _now
-        ):
-            if self._max_characters is None:
-                self._set_text(self._full_text, self.scale)
+        return self._animate(self._clock() if now is None else now, force)
+
+    async def animate(self, on_refresh: Optional[Callable[[], None]] = None) -> None:
+        """Coroutine that animates the label forever, sleeping until the next frame is due
+        instead of polling :py:meth:`update`. Run it as an ``asyncio`` task next to the
+        other tasks of the program. Requires the ``asyncio`` library. To animate many
+        labels use :py:meth:`adafruit_display_text.animation.Animator.run`. With
+        ``double_buffer`` the next frame is drawn ahead with :py:meth:`render_ahead` while
+        the coroutine waits for it to be due.
+
+        :param Optional[Callable[[], None]] on_refresh: Called after the label changed, for
+         example ``display.refresh`` when ``auto_refresh`` is off. Default is None.
+        """
+        import asyncio  # noqa: PLC0415, only loaded by labels that are animated this way
+
+        while True:
+            if self._animate(self._clock()) and on_refresh is not None:
+                on_refresh()
+            self.render_ahead()
+            # the frame is due once the clock has passed _next_animate_time()
+            wait = adafruit_ticks.ticks_diff(self._next_animate_time(), self._clock())
+            await asyncio.sleep(max(wait + 1, 0) / 1000)
+
+    def _next_animate_time(self) -> int:
+        # ticks_ms() value after which the next animation frame is due
+        return adafruit_ticks.ticks_add(self._last_animate_time, int(self.animate_time * 1000))
+
+    def _animate(self, _now: int, force: bool = False) -> bool:
+        # Body of update(), with the clock read by the caller so that an Animator can
+        # share one reading between many labels
+        if force or adafruit_ticks.ticks_less(self._next_animate_time(), _now):
+            if (
+                self._scroll_mode != Label.SCROLL_CHARACTERS
+                and self._label_direction != "RTL"
+                and self._max_characters is not None
+                and len(self.full_text) > self.max_characters
+            ):
+                return self._update_scroll(_now, force)
+
+            self._scroll_rendered = False
+            self._strip_window = None
+            self._strip_positions = None
+            self._ring_next = None
+
+            if self._max_characters is None or len(self.full_text) <= self.max_characters:
+                # nothing to scroll, only render changes that are still pending
                 self._last_animate_time = _now
-                return
-
-            if len(self.full_text) <= self.max_characters:
-                if self._text != self.full_text:
+                if force or self._dirty or (self._save_text and self._text != self.full_text):
                     self._set_text(self.full_text, self.scale)
-                self._last_animate_time = _now
-                return
-
-            if self.current_index + self.max_characters <= len(self.full_text):
-                _showing_string = self.full_text[
-                    self.current_index : self.current_index + self.max_characters
-                ]
-            else:
-                _showing_string_start = self.full_text[self.current_index :]
-                _showing_string_end = "{}".format(
-                    self.full_text[
-                        : (self.current_index + self.max_characters) % len(self.full_text)
-                    ]
-                )
+                    return True
+                return False
 
-                _showing_string = f"{_showing_string_start}{_showing_string_end}"
-            self._set_text(_showing_string, self.scale)
+            if not force:
+                # skip the frames that were missed, only the last one is shown
+                self.current_index += self._frame_steps(_now) - 1
+            self._set_text(self._showing_string(), self.scale)
             if not force:
                 self.current_index += 1
-            self._last_animate_time = _now
+            else:
+                self._last_animate_time = _now
 
             return True
 
         return False
 
+    def _showing_string(self) -> str:
+        # The max_characters of full_text shown from current_index on, wrapping around
+        start = self.current_index
+        end = start + self.max_characters
+        if end <= len(self.full_text):
+            return self.full_text[start:end]
+        return self.full_text[start:] + self.full_text[: end % len(self.full_text)]
+
+    def render_ahead(self) -> bool:
+        """Draw the next animation frame into the back Bitmap while there is time to spare,
+        for example right after refreshing the display, so that the next :py:meth:`update`
+        only has to show it. Requires ``double_buffer``, and only labels that scroll by
+        characters have frames to draw ahead. The work is not lost if the next frame turns
+        out different, because only the columns that differ are drawn again.
+
+        :return: bool rendered: whether the next frame was drawn
+        """
+        if not self._double_buffer or self._dirty or self._bitmap is None:
+            return False
+        if (
+            self._scroll_mode != Label.SCROLL_CHARACTERS
+            or self._max_characters is None
+            or len(self.full_text) <= self.max_characters
+        ):
+            return False
+        frame = self._layout_frame(self._showing_string())
+        if frame[4] != self._bitmap.width or frame[5] != self._bitmap.height:
+            return False  # the next frame needs a Bitmap of another size
+        self._render_back(*frame[6:])
+        return True
+
+    def _frame_steps(self, now: int) -> int:
+        # Number of animation frames that are due at time now. Without catch_up this is
+        # always one frame, timed from now. With catch_up the frames stay on the grid of
+        # animate_time, unless more than catch_up of them were missed.
+        interval = int(self.animate_time * 1000)
+        if not self._catch_up or interval <= 0:
+            self._last_animate_time = now
+            return 1
+        steps = max(adafruit_ticks.ticks_diff(now, self._last_animate_time) // interval, 1)
+        if steps > self._catch_up:
+            # too far behind, drop the frames beyond the limit
+            self._last_animate_time = now
+            return self._catch_up
+        self._last_animate_time = adafruit_ticks.ticks_add(
+            self._last_animate_time, steps * interval
+        )
+        return steps
+
+    def _update_scroll(self, now: int, force: bool) -> bool:
+        # Animation frame of the strip and ring scroll modes, moves the visible window
+        ring = self._scroll_mode == Label.SCROLL_RING
+        if not self._scroll_rendered:
+            if not (self._render_ring() if ring else self._render_strip()):
+                return False
+            self._scroll_rendered = True
+
+        if self._scroll_speed is None:
+            if force:
+                self._last_animate_time = now
+            else:
+                # skip the frames that were missed, only the last one is shown
+                for _ in range(self._frame_steps(now) - 1):
+                    if ring:
+                        self._ring_index_x += self._char_advance(self._current_index)
+                    self.current_index += 1
+            if ring:
+                self._ring_show(self._ring_index_x)
+                if not force:
+                    self._ring_index_x += self._char_advance(self._current_index)
+            else:
+                self._scroll_strip(self._strip_positions[self.current_index])
+            if not force:
+                self.current_index += 1
+            return True
+
+        if not force:
+            elapsed = adafruit_ticks.ticks_diff(now, self._last_animate_time)
+            self._strip_position += self._scroll_speed * elapsed / 1000
+            if not ring:
+                self._strip_position %= self._strip_period
+        self._last_animate_time = now
+        offset = int(self._strip_position)
+        if offset == self._strip_offset and not force:
+            return False
+        if ring:
+            self._ring_show(offset)
+        else:
+            self._scroll_strip(offset)
+        self._sync_current_index(int(self._strip_position))
+        return True
+
+    def _char_advance(self, index: int) -> int:
+        # Horizontal advance of full_text[index], as placed by _place_text
+        my_glyph = self._font.get_glyph(ord(self._full_text[index]))
+        advance = my_glyph.shift_x if my_glyph is not None else 0
+        if self._accent_ranges:
+            accent_slot = self._get_accent_map()[index]
+            if accent_slot and self._accent_ranges[accent_slot - 1][ACCENT_TYPE] == "outline":
+                advance += self._outline_size
+        return advance
+
+    def _window_width(self, period: int) -> Tuple[int, int]:
+        # Width of the scrolling window with and without padding. The visible text is
+        # as wide as max_characters characters of average width.
+        text_window = -(-period * self._max_characters // len(self._full_text))
+        window = text_window + self._padding_left + self._padding_right
+        if self._outline_color is not None:
+            window += self._outline_size * 2
+        return window, text_window
+
+    def _render_strip(self) -> bool:
+        # Render the full text once, followed by enough of its start to fill the visible
+        # window when it wraps around, into a wide strip Bitmap. update() then scrolls by
+        # changing which strip columns the TileGrid shows. Returns False if the text
+        # has no width to scroll.
+        text = self._full_text
+        advances = [self._char_advance(index) for index in range(len(text))]
+        period = sum(advances)
+        if period <= 0:
+            return False
+        window, text_window = self._window_width(period)
+
+        wrap_width = wrap_count = 0
+        while wrap_width < window:
+            wrap_width += advances[wrap_count % len(text)]
+            wrap_count += 1
+        strip_text = text + (text * (wrap_count // len(text) + 1))[:wrap_count]
+        strip_width = self._get_text_layout(strip_text)[0] + self._padding_left
+        strip_width += self._padding_right
+        if self._outline_color is not None:
+            strip_width += self._outline_size * 2
+        if strip_width > _MAX_TILE_COLUMNS:
+            raise ValueError(
+                f"SCROLL_STRIP needs a {strip_width} pixel wide strip, at most "
+                f"{_MAX_TILE_COLUMNS} are supported. Use SCROLL_RING for longer text."
+            )
+
+        positions = [0]
+        for advance in advances[:-1]:
+            positions.append(positions[-1] + advance)
+        self._strip_positions = positions
+        self._strip_period = period
+        self._strip_position = float(positions[self.current_index])
+        self._strip_window = (window, text_window)
+        self._set_text(strip_text, self.scale)
+        return True
+
+    def _render_ring(self) -> bool:
+        # Set up a Bitmap only a little wider than the visible window and use it as a
+        # ring buffer. _ring_show() renders each character into it as it enters the window,
+        # and the TileGrid shows the columns of the window wrapping around the Bitmap.
+        # Positions along the text are kept in "strip" coordinates, the ring column of
+        # strip coordinate x is x % ring width. Returns False if the text has no width.
+        text = self._full_text
+        font = self._font
+        period = widest = lead = 0
+        for index in range(len(text)):
+            advance = self._char_advance(index)
+            period += advance
+            my_glyph = font.get_glyph(ord(text[index]))
+            if my_glyph is not None:
+                lead = max(lead, -my_glyph.dx)
+                widest = max(
+                    widest,
+                    max(0, -my_glyph.dx) + max(my_glyph.dx + my_glyph.width, advance),
+                )
+        if period <= 0:
+            return False
+        window, text_window = self._window_width(period)
+
+        (
+            _,
+            tight_box_y,
+            x_offset,
+            tight_y_offset,
+            loose_box_y,
+            loose_y_offset,
+        ) = self._get_text_layout(text)
+        if self._background_tight:
+            box_y, y_offset = tight_box_y, tight_y_offset
+        else:
+            box_y, y_offset = loose_box_y, loose_y_offset
+        box_y += self._padding_top + self._padding_bottom
+        if self._outline_color is not None:
+            box_y += self._outline_size * 2
+
+        # characters are rendered once they reach the window, including the pixels that
+        # stick out to their left
+        spill = self._outline_size * 2
+        ring_width = window + widest + lead + spill * 3 + 1
+        if ring_width > _MAX_TILE_COLUMNS:
+            raise ValueError(
+                f"SCROLL_RING needs a {ring_width} pixel wide ring, at most "
+                f"{_MAX_TILE_COLUMNS} are supported. Use a smaller max_characters."
+            )
+        self._ring_lead = lead + spill
+        self._dirty = 0
+        self._release_bitmap()
+        self._bitmap = self._acquire_bitmap(ring_width, box_y)
+        self._ring_scratch = None
+        self._ring_y = self._padding_top + y_offset
+        self._ring_frontier = self._padding_left - x_offset
+        self._ring_claimed = 0
+        self._ring_next = self._current_index
+        self._ring_index_x = 0
+        self._strip_position = 0.0
+        self._strip_offset = 0
+        self._strip_window = (window, text_window)
+        self._text = text if self._save_text else None
+
+        self._update_tilegrid(True, x_offset, y_offset)
+        self._update_bounding_box(text_window, tight_box_y)
+        self.anchored_position = self._anchored_position
+        return True
+
+    def _ring_show(self, offset: int) -> None:
+        # Render the characters entering the window that starts at strip coordinate offset
+        # and show it
+        ring_width = self._bitmap.width
+        if offset >= ring_width:
+            # keep the coordinates small, the ring columns stay the same
+            offset -= ring_width
+            self._strip_position -= ring_width
+            self._ring_frontier -= ring_width
+            self._ring_claimed -= ring_width
+            self._ring_index_x -= ring_width
+
+        spill = self._outline_size * 2
+        while self._ring_frontier - self._ring_lead < offset + self._strip_window[0]:
+            advance = self._char_advance(self._ring_next)
+            if self._ring_frontier + advance + spill >= offset:
+                self._ring_place_char(self._ring_next, advance)
+            # else the character already scrolled out of view, skip it
+            self._ring_frontier += advance
+            self._ring_next = (self._ring_next + 1) % len(self._full_text)
+        self._scroll_strip(offset)
+
+    def _ring_place_char(self, index: int, advance: int) -> None:
+        # Render full_text[index], with its accent and outline, into a scratch Bitmap and
+        # copy that into the ring at the current frontier
+        my_glyph = self._font.get_glyph(ord(self._full_text[index]))
+        if my_glyph is None:
+            return
+        spill = self._outline_size * 2
+        margin = spill + max(0, -my_glyph.dx)
+        width = margin + max(my_glyph.dx + my_glyph.width, advance) + spill
+        ring = self._bitmap
+
+        scratch = self._ring_scratch
+        if scratch is None or scratch.width < width:
+            scratch = displayio.Bitmap(width, ring.height, len(self._palette))
+            self._ring_scratch = scratch
+        else:
+            scratch.fill(0)
+        self._place_text(
+            scratch, self._full_text[index], self._font, margin, self._ring_y, accent_offset=index
+        )
+        if self._outline_color is not None:
+            self._add_outline(scratch)
+
+        # Columns the ring has not used since they last scrolled out of view still hold
+        # old pixels, clear them before drawing over them.
+        left = self._ring_frontier - margin
+        self._ring_claimed = max(self._ring_claimed, left)
+        if left + width > self._ring_claimed:
+            self._ring_copy(None, self._ring_claimed, left + width)
+            self._ring_claimed = left + width
+        self._ring_copy(scratch, left, left + width)
+
+    def _ring_copy(self, scratch: Optional[displayio.Bitmap], start: int, end: int) -> None:
+        # Copy scratch columns into the ring columns of strip coordinates start to end,
+        # wrapping around the end of the ring. Clears the columns if scratch is None.
+        ring = self._bitmap
+        column = start % ring.width
+        source_x = 0
+        while source_x < end - start:
+            count = min(end - start - source_x, ring.width - column)
+            if scratch is None:
+                _fill_region(ring, column, 0, column + count, ring.height, 0)
+            elif not hasattr(bitmaptools, "blit"):
+                # the glyph foreground wins over the pixels of its neighbours
+                for y in range(ring.height):
+                    for x in range(count):
+                        value = scratch[source_x + x, y]
+                        if value != 0 and ring[column + x, y] != 1:
+                            ring[column + x, y] = value
+            else:
+                bitmaptools.blit(
+                    ring,
+                    scratch,
+                    column,
+                    0,
+                    x1=source_x,
+                    y1=0,
+                    x2=source_x + count,
+                    y2=ring.height,
+                    skip_source_index=0,
+                    skip_dest_index=1,
+                )
+            source_x += count
+            column = 0
+
+    def _scroll_strip(self, offset: int) -> None:
+        # Show the strip starting at column offset, wrapping around for the ring buffer
+        self._strip_offset = offset
+        tilegrid = self._tilegrid
+        width = self._bitmap.width
+        for column in range(self._strip_window[0]):
+            tilegrid[column] = (offset + column) % width
+        self._add_damage()
+
+    def _sync_current_index(self, offset: int) -> None:
+        # Point current_index at the character the window starts in
+        if self._ring_next is not None:
+            advance = self._char_advance(self._current_index)
+            while self._ring_index_x + advance <= offset:
+                self._ring_index_x += advance
+                self._current_index = (self._current_index + 1) % len(self._full_text)
+                advance = self._char_advance(self._current_index)
+            return
+
+        positions = self._strip_positions
+        index = self._current_index
+        while not (
+            positions[index]
+            <= offset
+            < (positions[index + 1] if index + 1 < len(positions) else self._strip_period)
+        ):
+            index = (index + 1) % len(positions)
+        self._current_index = index
+
     @property
     def current_index(self) -> int:
         """Index of the first visible character.
@@ -883,10 +1952,15 @@ class Label(LabelBase):
                 new_text = f"{new_text} "
             if new_text != self._full_text:
                 self._full_text = new_text
+                self._scroll_rendered = False
                 self.current_index = 0
-                self.update(True)
-        else:
+                if self._coalesce:
+                    self._dirty |= _DIRTY_TEXT
+                else:
+                    self.update(True)
+        elif new_text != self._full_text:
             self._full_text = new_text
+            self._dirty |= _DIRTY_TEXT
 
     @property
     def max_characters(self):
@@ -905,6 +1979,8 @@ class Label(LabelBase):
         """
         if new_max_characters != self._max_characters:
             self._max_characters = new_max_characters
+            self._scroll_rendered = False
+            self._dirty |= _DIRTY_TEXT
             self.full_text = self.full_text
 
     @property
@@ -935,12 +2011,13 @@ class Label(LabelBase):
         self._padding_right = max(self._padding_right, self.outline_size)
 
         self._init_outline_stamp(new_outline_size)
-        self._reset_text(
-            font=self._font,
-            text=self._text,
-            line_spacing=self._line_spacing,
-            scale=self.scale,
-        )
+        if not self._deferred(_DIRTY_STYLE):
+            self._reset_text(
+                font=self._font,
+                text=self._text,
+                line_spacing=self._line_spacing,
+                scale=self.scale,
+            )
 
     def add_accent_range(
         self, start, end, foreground_color, background_color, accent_type="foreground_background"
@@ -957,16 +2034,134 @@ class Label(LabelBase):
         :param accent_type: The type of accent to use, either "foreground_background" or "outline"
         :return: None
         """
+        self._append_accent_range(
+            self._check_accent_range(start, end, foreground_color, background_color, accent_type)
+        )
+        self._accents_changed()
+
+    @staticmethod
+    def _check_accent_range(
+        start, end, foreground_color, background_color, accent_type="foreground_background"
+    ):
+        # Validate an accent and return it in the form stored in _accent_ranges
         if accent_type not in {"foreground_background", "outline"}:
             raise ValueError("accent_type must be either 'foreground_background' or 'outline'")
+        return start, end, foreground_color, background_color, accent_type
 
-        if accent_type == "outline":
+    def _append_accent_range(self, accent_range):
+        # Add an accent returned by _check_accent_range()
+        if accent_range[ACCENT_TYPE] == "outline":
             self._padding_bottom = max(self._padding_bottom, self.outline_size)
             self._padding_top = max(self._padding_top, self.outline_size)
             self._padding_left = max(self._padding_left, self.outline_size)
             self._padding_right = max(self._padding_right, self.outline_size)
-        self._accent_ranges.append((start, end, foreground_color, background_color, accent_type))
-        self._reset_text(text=str(self._text))
+        self._accent_ranges.append(accent_range)
+
+    def add_accent_color_range(
+        self, start, end, foreground_color, background_color, accent_type="foreground_background"
+    ):
+        """
+        Accent a range of text with colors given as RGB values instead of ``color_palette``
+        indexes. The label puts the colors into one of its ``accent_slots``, so that
+        ``set_accent_colors`` can change them later without drawing the text again.
+
+        :param start: The start index of the range of text to accent, inclusive.
+        :param end: The end index of the range of text to accent, exclusive.
+        :param foreground_color: The foreground color as an RGB hex number.
+        :param background_color: The background color as an RGB hex number, or None for
+          transparent. With the "outline" accent_type this is the outline color.
+        :param accent_type: The type of accent to use, either "foreground_background" or "outline"
+        :return: None
+        """
+        # a slot is also busy when an accent added by index uses one of its colors
+        used = set(self._allocated_slots)
+        for accent_range in self._accent_ranges:
+            used.add(accent_range[ACCENT_FG])
+            used.add(accent_range[ACCENT_BG])
+        for slot in self._accent_slots:
+            if slot not in used and slot + 1 not in used:
+                break
+        else:
+            raise RuntimeError("All accent_slots are in use")
+        self._allocated_slots.add(slot)
+        self._set_palette_color(slot, foreground_color)
+        self._set_palette_color(slot + 1, background_color)
+        self.add_accent_range(start, end, slot, slot + 1, accent_type)
+
+    def set_accent_colors(self, start, foreground_color, background_color):
+        """
+        Change the colors of the accent that starts at the specified index within the text.
+        The accent must have been added with ``add_accent_color_range``. Only the palette
+        changes, the text is not drawn again.
+
+        :param start: The start index of the range of accented text, inclusive.
+        :param foreground_color: The foreground color as an RGB hex number.
+        :param background_color: The background color as an RGB hex number, or None for
+          transparent.
+        :return: None
+        """
+        for accent_range in self._accent_ranges:
+            if accent_range[ACCENT_START] == start and self._owns_slot(accent_range):
+                self._set_palette_color(accent_range[ACCENT_FG], foreground_color)
+                self._set_palette_color(accent_range[ACCENT_BG], background_color)
+                return
+        raise ValueError("No accent with label-managed colors starts at this index")
+
+    def _owns_slot(self, accent_range) -> bool:
+        # whether the accent uses the colors of a slot set by add_accent_color_range()
+        return (
+            accent_range[ACCENT_FG] in self._allocated_slots
+            and accent_range[ACCENT_BG] == accent_range[ACCENT_FG] + 1
+        )
+
+    def _release_slots(self) -> None:
+        # free the allocated slots that no accent uses anymore
+        self._allocated_slots = {
+            accent_range[ACCENT_FG]
+            for accent_range in self._accent_ranges
+            if self._owns_slot(accent_range)
+        }
+
+    def _set_palette_color(self, index: int, color: Optional[int]) -> None:
+        if color is None:
+            self._palette[index] = 0
+            self._palette.make_transparent(index)
+        else:
+            self._palette[index] = color
+            self._palette.make_opaque(index)
+
+    def set_accent_ranges(self, accent_ranges):
+        """
+        Replace all the accents with new ones, rendering the text only once.
+
+        :param accent_ranges: Iterable of accents, each a tuple of
+          (start, end, foreground_color, background_color) or
+          (start, end, foreground_color, background_color, accent_type) with the same
+          meaning as the arguments of ``add_accent_range``.
+        :return: None
+        """
+        # check them all first, so that an invalid accent leaves the current ones in place
+        new_ranges = [self._check_accent_range(*accent_range) for accent_range in accent_ranges]
+        self._accent_ranges = []
+        for accent_range in new_ranges:
+            self._append_accent_range(accent_range)
+        self._release_slots()
+        self._accents_changed()
+
+    def accent_batch(self):
+        """
+        Context manager that delays rendering the accent changes made inside it
+        until it exits, so that any number of changes cost one render.
+
+        .. code-block:: python
+
+            with label.accent_batch():
+                for keyword in ("def", "return"):
+                    label.add_accent_to_substring(keyword, 2, 0)
+
+        :return: The context manager
+        """
+        return _AccentBatch(self)
 
     def remove_accent_range(self, start):
         """
@@ -978,7 +2173,8 @@ class Label(LabelBase):
         for accent_range in reversed(self._accent_ranges):
             if accent_range[0] == start:
                 self._accent_ranges.remove(accent_range)
-        self._reset_text(text=str(self._text))
+        self._release_slots()
+        self._accents_changed()
 
     def add_accent_to_substring(
         self,
@@ -1031,6 +2227,19 @@ class Label(LabelBase):
         else:
             return False
 
+    def _accents_changed(self) -> None:
+        self._dirty |= _DIRTY_ACCENTS
+        self._accent_map = None
+        if self._accent_batch_depth:
+            return  # rendered when the outermost accent_batch() exits
+        if self._strip_window is not None:
+            # accents can change the character advances, render the scroll again
+            self._scroll_rendered = False
+            if not self._coalesce:
+                self.update(True)
+        elif not self._coalesce:
+            self._reset_text(text=str(self._text))
+
     @property
     def accent_ranges(self):
         """
@@ -1047,7 +2256,8 @@ class Label(LabelBase):
         :return: None
         """
         self._accent_ranges = []
-        self._reset_text(text=str(self._text))
+        self._allocated_slots = set()
+        self._accents_changed()
 
     @property
     def text(self):
@@ -1063,7 +2273,8 @@ class Label(LabelBase):
         if new_text == self.full_text:
             return
         self.full_text = new_text
-        self.update(True)
+        if not self._coalesce:
+            self.update(True)
 
     @property
     def tilegrid(self) -> displayio.TileGrid:
@@ -1071,3 +2282,57 @@ class Label(LabelBase):
         The TileGrid that contains the Bitmap for this Label.
         """
         return self._tilegrid
+
+    @property
+    def display_dirty_rect(self) -> Optional[Tuple[int, int, int, int]]:
+        """The rectangle of the display that changed since the last call of
+        :py:meth:`clear_dirty_rect`, as (x, y, width, height), or None if nothing changed.
+        Covers the pixels that were drawn again, the whole label when its palette changed, and
+        both the old and the new area of the label when it moved or changed size. The
+        ``scale``, ``anchored_position`` and ``label_direction`` of the label are applied.
+        Display coordinates assume that the groups the label is in are neither moved
+        nor scaled."""
+        state = self._display_state()
+        if self._clean is None:
+            area = state[0]
+        elif self._clean != state:
+            area = _union_area(self._clean[0], state[0])
+        elif self._changed is None or state[0] is None:
+            area = None
+        else:
+            area = self._display_area(self._shown_area(*self._changed))
+        if area is None:
+            return None
+        return area[0], area[1], area[2] - area[0], area[3] - area[1]
+
+    @property
+    def dirty_rect(self) -> Optional[Tuple[int, int, int, int]]:
+        """The rectangle that changed since the last call of :py:meth:`clear_dirty_rect`, as
+        (x, y, width, height) relative to the ``x`` and ``y`` of the label, or None if nothing
+        changed. See :py:attr:`display_dirty_rect`."""
+        rect = self.display_dirty_rect
+        if rect is None:
+            return None
+        return rect[0] - self.x, rect[1] - self.y, rect[2], rect[3]
+
+    def clear_dirty_rect(self) -> None:
+        """Mark the label as unchanged, usually after the display was refreshed. The
+        following changes are reported by :py:attr:`dirty_rect`."""
+        self._clean = self._display_state()
+        self._changed = None
+
+
+class _AccentBatch:
+    # Context manager returned by Label.accent_batch(), batches can be nested
+    def __init__(self, label: Label) -> None:
+        self._label = label
+
+    def __enter__(self) -> Label:
+        self._label._accent_batch_depth += 1
+        return self._label
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        label = self._label
+        label._accent_batch_depth -= 1
+        if not label._accent_batch_depth and label._dirty & _DIRTY_ACCENTS:
+            label._accents_changed()
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_display_text.bitmap_pool`
+================================================================================
+
+Pool of Bitmaps that labels can share as render targets
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
+
+import displayio
+
+
+def bitmap_bytes(width: int, height: int, value_count: int) -> int:
+    """The number of bytes of pixel data a :py:class:`~displayio.Bitmap` of this size uses.
+
+    :param int width: Width of the Bitmap in pixels
+    :param int height: Height of the Bitmap in pixels
+    :param int value_count: Number of different values the Bitmap can hold
+    :return: The size of the pixel data in bytes
+    :rtype: int
+    """
+    bits = 1
+    while (value_count - 1) >> bits:
+        if bits < 8:
+            bits <<= 1
+        else:
+            bits += 8
+    # rows are padded to whole 32 bit words
+    return ((width * bits + 31) // 32) * 4 * height
+
+
+class BitmapPool:
+    """Keeps Bitmaps that labels no longer need so that other labels can reuse them
+    instead of allocating new ones. Share one pool between all the labels of an
+    application by passing it as the ``bitmap_pool`` argument of
+    :py:class:`~adafruit_display_text.bitmap_label.Label`.
+
+    Bitmaps are matched by their width, height and value count. When the free Bitmaps
+    would use more than ``max_bytes``, the ones released longest ago are dropped.
+
+    :param int max_bytes: The maximum number of bytes of pixel data the free Bitmaps
+     in the pool may use. Default is 8192.
+    """
+
+    def __init__(self, max_bytes: int = 8192) -> None:
+        self._max_bytes = max_bytes
+        self._free_bytes = 0
+        # (key, bitmap, size in bytes) tuples, least recently released first
+        self._free = []
+
+    def acquire(self, width: int, height: int, value_count: int) -> displayio.Bitmap:
+        """Get a Bitmap with all pixels set to 0, reusing a free one when possible.
+
+        :param int width: Width of the Bitmap in pixels
+        :param int height: Height of the Bitmap in pixels
+        :param int value_count: Number of different values the Bitmap must hold
+        :rtype: displayio.Bitmap
+        """
+        key = (width, height, value_count)
+        for index in range(len(self._free) - 1, -1, -1):
+            if self._free[index][0] == key:
+                _, bitmap, size = self._free.pop(index)
+                self._free_bytes -= size
+                bitmap.fill(0)
+                return bitmap
+        return self._new_bitmap(width, height, value_count)
+
+    def _new_bitmap(self, width: int, height: int, value_count: int) -> displayio.Bitmap:
+        # Create a Bitmap when no free one matches, subclasses may create other types
+        return displayio.Bitmap(width, height, value_count)
+
+    def release(self, bitmap: displayio.Bitmap, value_count: int) -> None:
+        """Hand a Bitmap back to the pool. It must not be used by the caller anymore.
+
+        :param displayio.Bitmap bitmap: The Bitmap that is no longer needed
+        :param int value_count: The value count the Bitmap was created with
+        """
+        size = bitmap_bytes(bitmap.width, bitmap.height, value_count)
+        if size > self._max_bytes:
+            return
+        while self._free_bytes + size > self._max_bytes:
+            self._free_bytes -= self._free.pop(0)[2]
+        self._free.append(((bitmap.width, bitmap.height, value_count), bitmap, size))
+        self._free_bytes += size
+
+    def clear(self) -> None:
+        """Drop all the free Bitmaps so their memory can be garbage collected."""
+        self._free = []
+        self._free_bytes = 0
+
+    @property
+    def free_bytes(self) -> int:
+        """The number of bytes of pixel data used by the free Bitmaps in the pool."""
+        return self._free_bytes
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum number of bytes the free Bitmaps in the pool may use."""
+        return self._max_bytes
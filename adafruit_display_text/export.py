@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_display_text.export`
+================================================================================
+
+Write the pixels of a :py:class:`~adafruit_display_text.bitmap_label.Label` into a
+framebuffer, for hosts that drive a display directly
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
+
+from adafruit_display_text.bitmap_label import _pixel_buffer
+
+try:
+    from typing import Optional, Tuple, Union
+
+    from adafruit_display_text.bitmap_label import Label
+except ImportError:
+    pass
+
+
+def export_rgb565(
+    label: Label,
+    buffer: Union[bytearray, memoryview],
+    offset: int = 0,
+    stride: Optional[int] = None,
+    dirty_only: bool = True,
+    background: int = 0x000000,
+    swap_bytes: bool = False,
+) -> Optional[Tuple[int, int, int, int]]:
+    """Write the pixels of a label, as they are shown, into a buffer in the RGB565 format
+    of most color displays. The ``label_direction`` and the scrolling window are applied,
+    the ``scale`` is not: each label pixel is one buffer pixel. Only the pixels that changed
+    since the last export are written, unless ``dirty_only`` is False. Works with
+    :py:class:`~adafruit_display_text.bitmap_label.Label` and
+    :py:class:`~adafruit_display_text.text_box.TextBox` objects.
+
+    :param Label label: The label to export
+    :param bytearray|memoryview buffer: The buffer to write into, two bytes per pixel
+    :param int offset: Position in ``buffer`` of the top left pixel of the label, in bytes.
+     Default is 0.
+    :param Optional[int] stride: Number of bytes from the start of one row to the start of
+     the next one. Default is None, two bytes per pixel of the width of the label.
+    :param bool dirty_only: Whether to only write the pixels that changed since the last
+     export. Changes of the palette make all the pixels change. Default is True.
+    :param int background: The color written for the transparent pixels, as an RGB hex
+     number. Default is 0x000000, black.
+    :param bool swap_bytes: Whether to write the high byte of each pixel first, as most
+     SPI displays take it. Default is False, the low byte first.
+    :return: The (x, y, width, height) of the rectangle that was written, in pixels of the
+     label, or None if nothing was written
+    :rtype: Optional[Tuple[int, int, int, int]]
+    """
+    tilegrid = label.tilegrid
+    if tilegrid is None or len(label._local_group) == 0:
+        label._damage = None
+        return None
+
+    palette = tilegrid.pixel_shader
+    colors = []
+    for index in range(len(palette)):
+        color = background if palette.is_transparent(index) else palette[index]
+        color = ((color >> 8) & 0xF800) | ((color >> 5) & 0x07E0) | ((color >> 3) & 0x001F)
+        if swap_bytes:
+            colors.append(bytes((color >> 8, color & 0xFF)))
+        else:
+            colors.append(bytes((color & 0xFF, color >> 8)))
+
+    bitmap = tilegrid.bitmap
+    tile_width = tilegrid.tile_width
+    width = tilegrid.width * tile_width
+    height = tilegrid.tile_height
+    if colors != label._export_colors:
+        label._export_colors = colors
+        label._add_damage()
+    damage = label._damage if dirty_only else (0, 0, width, height)
+    label._damage = None
+    if damage is None:
+        return None
+
+    # the damaged rectangle of the TileGrid, where it is shown
+    transpose_xy, flip_x, flip_y = tilegrid.transpose_xy, tilegrid.flip_x, tilegrid.flip_y
+    area = label._shown_area(*damage)
+    if area is None:
+        return None
+    x1, y1, x2, y2 = area
+    shown_width = height if transpose_xy else width
+    if stride is None:
+        stride = shown_width * 2
+    if offset < 0 or offset + (y2 - 1) * stride + x2 * 2 > len(buffer):
+        raise ValueError("buffer is too small")
+
+    # column of the bitmap for each column of the TileGrid
+    tile_columns = bitmap.width // tile_width
+    source_x = [
+        (tilegrid[column // tile_width] % tile_columns) * tile_width + column % tile_width
+        for column in range(width)
+    ]
+    pixels = _pixel_buffer(bitmap) or bitmap
+    for y in range(y1, y2):
+        position = offset + y * stride + x1 * 2
+        for x in range(x1, x2):
+            # undo the direction to find the TileGrid pixel shown here
+            column, row = (y, x) if transpose_xy else (x, y)
+            if flip_x:
+                column = width - 1 - column
+            if flip_y:
+                row = height - 1 - row
+            value = pixels[row * bitmap.width + source_x[column]]
+            buffer[position : position + 2] = colors[value]
+            position += 2
+    return x1, y1, x2 - x1, y2 - y1
@@ -0,0 +1,415 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_display_text.headless`
+================================================================================
+
+Render labels into NumPy arrays without a display
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* CPython and NumPy: https://numpy.org
+
+The text is laid out and drawn by the code of
+:py:class:`~adafruit_display_text.bitmap_label.Label`, so the pixels are the same as on a
+display, but no Group, TileGrid or Palette is created. The text is drawn into an
+:py:class:`ArrayBitmap` with :py:mod:`~adafruit_display_text.numpy_bitmaptools`, the
+colors are kept in a NumPy array, and the ``label_direction`` and ``scale`` are applied
+to the array.
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
+
+import multiprocessing
+
+import numpy
+
+from adafruit_display_text import LabelBase
+from adafruit_display_text.bitmap_label import Label
+from adafruit_display_text.bitmap_pool import BitmapPool
+
+try:
+    import terminalio
+    from adafruit_bitmap_font import bitmap_font
+except ImportError:
+    # only needed by render_batch()
+    pass
+
+try:
+    from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+    from fontio import FontProtocol
+except ImportError:
+    pass
+
+# fonts loaded by the render_batch() worker processes, by path
+_fonts = {}
+
+
+class ArrayBitmap:
+    """A Bitmap that keeps its pixels in a NumPy array of one byte per pixel, so that they
+    can be read and changed without copying. It has the parts of the
+    :py:class:`~displayio.Bitmap` interface that labels draw with, but cannot be shown
+    on a display.
+
+    :param int width: Width of the Bitmap in pixels
+    :param int height: Height of the Bitmap in pixels
+    :param int value_count: Number of different values the Bitmap can hold, at most 256
+    """
+
+    def __init__(self, width: int, height: int, value_count: int) -> None:
+        if value_count > 256:
+            raise ValueError("value_count must be at most 256")
+        self._array = numpy.zeros((height, width), dtype=numpy.uint8)
+
+    def _index(self, index: Union[Tuple[int, int], int]) -> Tuple[int, int]:
+        if isinstance(index, tuple):
+            x, y = index
+        else:
+            y, x = divmod(index, self._array.shape[1])
+        if not (0 <= x < self._array.shape[1] and 0 <= y < self._array.shape[0]):
+            raise IndexError("Index out of range")
+        return y, x
+
+    def __getitem__(self, index: Union[Tuple[int, int], int]) -> int:
+        return int(self._array[self._index(index)])
+
+    def __setitem__(self, index: Union[Tuple[int, int], int], value: int) -> None:
+        self._array[self._index(index)] = value
+
+    def __array__(self, dtype=None, copy=None) -> numpy.ndarray:  # noqa: PLW3201, NumPy protocol
+        if dtype is not None and dtype != self._array.dtype:
+            return self._array.astype(dtype)
+        return self._array.copy() if copy else self._array
+
+    def fill(self, value: int) -> None:
+        """Set all the pixels to a value.
+
+        :param int value: The value to set
+        """
+        self._array.fill(value)
+
+    @property
+    def width(self) -> int:
+        """Width of the Bitmap in pixels."""
+        return self._array.shape[1]
+
+    @property
+    def height(self) -> int:
+        """Height of the Bitmap in pixels."""
+        return self._array.shape[0]
+
+    @property
+    def bits_per_value(self) -> int:
+        """Bits used to store each value, always 8."""
+        return 8
+
+    @property
+    def array(self) -> numpy.ndarray:
+        """The pixels, as a (height, width) array of ``uint8`` that can be changed."""
+        return self._array
+
+
+class _ArrayBitmapPool(BitmapPool):
+    # A BitmapPool that creates ArrayBitmaps
+    def _new_bitmap(self, width: int, height: int, value_count: int) -> ArrayBitmap:
+        return ArrayBitmap(width, height, value_count)
+
+
+# pool shared by the labels rendered in this process
+_bitmap_pool = _ArrayBitmapPool()
+
+
+class _LabelRaster:
+    # The state of a Label that its layout and drawing methods use, set up from the
+    # arguments of Label, so that those methods can draw the text into an ArrayBitmap
+    # without creating a Group, TileGrid or Palette.
+
+    _get_ascent_descent = LabelBase._get_ascent_descent
+    _replace_tabs = LabelBase._replace_tabs
+    _check_accent_range = staticmethod(Label._check_accent_range)
+    _append_accent_range = Label._append_accent_range
+    _layout_frame = Label._layout_frame
+    _get_text_layout = Label._get_text_layout
+    _text_bounding_box = Label._text_bounding_box
+    _line_spacing_ypixels = staticmethod(Label._line_spacing_ypixels)
+    _bitmap_size = Label._bitmap_size
+    _text_accents = Label._text_accents
+    _get_accent_map = Label._get_accent_map
+    _has_outline_accent = Label._has_outline_accent
+    _place_text = Label._place_text
+    _add_outline = Label._add_outline
+    _blit = Label._blit
+
+    # a label that does not scroll shows its text from the first character on
+    current_index = 0
+
+    def __init__(
+        self,
+        font: FontProtocol,
+        text: str = "",
+        color: Optional[int] = 0xFFFFFF,
+        background_color: Optional[int] = None,
+        line_spacing: float = 1.25,
+        background_tight: bool = False,
+        padding_top: Optional[int] = None,
+        padding_bottom: Optional[int] = None,
+        padding_left: Optional[int] = None,
+        padding_right: Optional[int] = None,
+        scale: int = 1,
+        tab_replacement: Tuple[int, str] = (4, " "),
+        label_direction: str = "LTR",
+        outline_color: Optional[int] = None,
+        outline_size: int = 1,
+        accents: Sequence[tuple] = (),
+        verbose: bool = False,
+    ) -> None:
+        if label_direction not in Label._DIR_MAP:
+            raise RuntimeError("Please provide a valid text direction")
+        self._font = font
+        self._line_spacing = line_spacing
+        self._background_tight = background_tight
+        # the padding leaves room for the outline unless it is given
+        padding = 0 if outline_color is None else outline_size
+        self._padding_top = padding if padding_top is None else padding_top
+        self._padding_bottom = padding if padding_bottom is None else padding_bottom
+        self._padding_left = padding if padding_left is None else padding_left
+        self._padding_right = padding if padding_right is None else padding_right
+        self._scale = scale
+        self._tab_text = tab_replacement[1] * tab_replacement[0]
+        self._label_direction = label_direction
+        self._outline_color = outline_color
+        self._outline_size = outline_size
+        self._verbose = verbose
+        self._ascent, self._descent = self._get_ascent_descent()
+        self._full_text = text
+        self._text = self._replace_tabs(text)
+
+        # the palette of a Label, followed by an accent slot for each accent
+        self.colors = numpy.zeros(3 + len(accents) * 2, dtype=numpy.uint32)
+        self.opaque = numpy.ones(len(self.colors), dtype=bool)
+        self._set_color(0, background_color)
+        # the palette of a Label keeps a color of None as opaque black
+        self._set_color(1, 0 if color is None else color)
+        self._set_color(2, 0x999999 if outline_color is None else outline_color)
+        self._palette = self.colors
+
+        self._accent_ranges = []
+        self._accent_map = None
+        self._accent_map_text = None
+        for slot, accent in enumerate(accents):
+            start, end, foreground_color, background_color = accent[:4]
+            self._set_color(3 + slot * 2, foreground_color)
+            self._set_color(4 + slot * 2, background_color)
+            self._append_accent_range(
+                self._check_accent_range(start, end, 3 + slot * 2, 4 + slot * 2, *accent[4:])
+            )
+
+        self._layout_key = None
+        self._layout = None
+        self._capacity = None
+        self._strip_window = None
+        self._bitmap = None
+        self._back_bitmap = None
+
+    @property
+    def font(self) -> FontProtocol:
+        """The font of the text."""
+        return self._font
+
+    @property
+    def outline_size(self) -> int:
+        """The size of the outline in pixels."""
+        return self._outline_size
+
+    def _set_color(self, index: int, color: Optional[int]) -> None:
+        # Set a palette color, None is transparent
+        self.colors[index] = 0 if color is None else color
+        self.opaque[index] = color is not None
+
+    def render(self) -> numpy.ndarray:
+        """The palette indexes of the pixels of the label, as it is shown.
+
+        :return: A (height, width) array of ``uint8``, empty when the text is
+        :rtype: numpy.ndarray
+        """
+        if not self._text:
+            return numpy.zeros((0, 0), dtype=numpy.uint8)
+        layout = self._layout_frame(self._text)
+        bitmap_x, bitmap_y, placed_text = layout[4:7]
+        x_start, y_start = layout[9:11]
+        self._bitmap = _bitmap_pool.acquire(bitmap_x, bitmap_y, len(self.colors))
+        try:
+            self._place_text(self._bitmap, placed_text, self._font, x_start, y_start)
+            pixels = self._bitmap.array
+            # the flips apply to the bitmap, before the axes are swapped, like in a TileGrid
+            transpose_xy, flip_x, flip_y = Label._DIR_MAP[self._label_direction]
+            if flip_x:
+                pixels = pixels[:, ::-1]
+            if flip_y:
+                pixels = pixels[::-1]
+            if transpose_xy:
+                pixels = pixels.T
+            if self._scale > 1:
+                pixels = numpy.repeat(
+                    numpy.repeat(pixels, self._scale, axis=0), self._scale, axis=1
+                )
+            # a copy, so the bitmap can go back to the pool
+            return numpy.array(pixels, dtype=numpy.uint8)
+        finally:
+            _bitmap_pool.release(self._bitmap, len(self.colors))
+            self._bitmap = None
+
+
+def render_indices(
+    font: FontProtocol, text: str, **kwargs
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """The palette indexes of the pixels of a label, as it is shown, and its palette.
+    The label is drawn the way :py:class:`~adafruit_display_text.bitmap_label.Label` draws
+    it, with the ``label_direction`` and ``scale`` applied.
+
+    These arguments of :py:class:`~adafruit_display_text.bitmap_label.Label` are supported,
+    with the same meaning and default: ``color``, ``background_color``, ``line_spacing``,
+    ``background_tight``, ``padding_top``, ``padding_bottom``, ``padding_left``,
+    ``padding_right``, ``scale``, ``tab_replacement``, ``label_direction``,
+    ``outline_color``, ``outline_size`` and ``verbose``. Accents are given as ``accents``,
+    a list of ``(start, end, foreground_color, background_color, accent_type)`` tuples with
+    RGB colors, as taken by ``add_accent_color_range``. The ``accent_type`` may be left out.
+
+    :param font: The font to draw the text with
+    :type font: ~fontio.FontProtocol
+    :param str text: The text to draw
+    :return: A (height, width) array of ``uint8`` with the palette index of each pixel,
+     empty when the text is, followed by a (count, 3) array of ``uint8`` with the red, green
+     and blue of each palette color and an array of ``bool`` that is True for the colors that
+     are opaque
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    raster = _LabelRaster(font, text, **kwargs)
+    indices = raster.render()
+    rgb = numpy.empty((len(raster.colors), 3), dtype=numpy.uint8)
+    rgb[:, 0] = raster.colors >> 16
+    rgb[:, 1] = (raster.colors >> 8) & 0xFF
+    rgb[:, 2] = raster.colors & 0xFF
+    return indices, rgb, raster.opaque
+
+
+def render_rgb(
+    font: FontProtocol, text: str, background: int = 0x000000, **kwargs
+) -> numpy.ndarray:
+    """The colors of the pixels of a label, as it is shown. Takes the same arguments as
+    :py:func:`render_indices`.
+
+    :param font: The font to draw the text with
+    :type font: ~fontio.FontProtocol
+    :param str text: The text to draw
+    :param int background: The color shown behind the transparent pixels, as an RGB hex
+     number. Default is 0x000000, black.
+    :return: A (height, width, 3) array of ``uint8`` with the red, green and blue of each pixel
+    :rtype: numpy.ndarray
+    """
+    indices, rgb, opaque = render_indices(font, text, **kwargs)
+    rgb[~opaque] = ((background >> 16) & 0xFF, (background >> 8) & 0xFF, background & 0xFF)
+    return rgb[indices]
+
+
+def render_rgb565(
+    font: FontProtocol,
+    text: str,
+    background: int = 0x000000,
+    swap_bytes: bool = False,
+    **kwargs,
+) -> numpy.ndarray:
+    """The colors of the pixels of a label in the RGB565 format of most color displays.
+    Takes the same arguments as :py:func:`render_indices`.
+
+    :param font: The font to draw the text with
+    :type font: ~fontio.FontProtocol
+    :param str text: The text to draw
+    :param int background: The color shown behind the transparent pixels, as an RGB hex
+     number. Default is 0x000000, black.
+    :param bool swap_bytes: Swap the two bytes of each pixel, for displays that take the
+     high byte first. Default is False.
+    :return: A (height, width) array of ``uint16``
+    :rtype: numpy.ndarray
+    """
+    indices, rgb, opaque = render_indices(font, text, **kwargs)
+    rgb[~opaque] = ((background >> 16) & 0xFF, (background >> 8) & 0xFF, background & 0xFF)
+    rgb = rgb.astype(numpy.uint16)
+    colors = ((rgb[:, 0] & 0xF8) << 8) | ((rgb[:, 1] & 0xFC) << 3) | (rgb[:, 2] >> 3)
+    if swap_bytes:
+        colors = colors.byteswap()
+    return colors[indices]
+
+
+def _load_font(path: Optional[str]) -> FontProtocol:
+    # Load a font once per process, None is the built in terminalio.FONT
+    if path is None:
+        return terminalio.FONT
+    font = _fonts.get(path)
+    if font is None:
+        font = bitmap_font.load_font(path)
+        _fonts[path] = font
+    return font
+
+
+def _render_spec(job: Tuple[int, dict, str, int]) -> Tuple[int, object]:
+    # Render one label spec of render_batch() in a worker process
+    index, spec, output, background = job
+    kwargs = dict(spec)
+    font = _load_font(kwargs.pop("font", None))
+    text = kwargs.pop("text", "")
+    if output == "indices":
+        return index, render_indices(font, text, **kwargs)
+    if output == "rgb565":
+        return index, render_rgb565(font, text, background, **kwargs)
+    return index, render_rgb(font, text, background, **kwargs)
+
+
+def render_batch(
+    specs: Iterable[dict],
+    output: str = "rgb",
+    background: int = 0x000000,
+    processes: Optional[int] = None,
+    chunksize: int = 8,
+) -> Iterator[Tuple[int, object]]:
+    """Render many labels in a pool of worker processes, for using all the cores of a
+    computer. The results are yielded as soon as they are ready, which is not necessarily
+    in the order of ``specs``. Each worker process loads each font once.
+
+    Each spec is a dict of the arguments of :py:func:`render_indices`, for example
+    ``text``, ``color``, ``background_color``, ``padding_left``, ``outline_size`` or
+    ``accents``, where ``font`` is the path of a font file to load with
+    ``adafruit_bitmap_font``. Default is None, ``terminalio.FONT``.
+
+    The specs and the results are sent between the processes, so on platforms that start
+    new processes by spawning, call this function from the ``if __name__ == "__main__":``
+    block of the script.
+
+    :param Iterable[dict] specs: The labels to render
+    :param str output: What to render, "rgb" for :py:func:`render_rgb`, "rgb565" for
+     :py:func:`render_rgb565` or "indices" for the three arrays of
+     :py:func:`render_indices`. Default is "rgb".
+    :param int background: The color shown behind the transparent pixels, as an RGB hex
+     number. Default is 0x000000, black.
+    :param Optional[int] processes: Number of worker processes. Default is None, one per core.
+    :param int chunksize: Number of specs sent to a worker process at once. Default is 8.
+    :return: Iterator of the index of each spec in ``specs`` and its rendered image
+    :rtype: Iterator[Tuple[int, object]]
+    """
+    if output not in {"rgb", "rgb565", "indices"}:
+        raise ValueError("output must be one of: 'rgb', 'rgb565', 'indices'")
+    jobs = ((index, spec, output, background) for index, spec in enumerate(specs))
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap_unordered(_render_spec, jobs, chunksize)
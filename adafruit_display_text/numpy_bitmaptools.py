@@ -0,0 +1,304 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_display_text.numpy_bitmaptools`
+================================================================================
+
+NumPy versions of the ``bitmaptools`` functions used to render labels
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* NumPy: https://numpy.org
+
+On hosts that run CPython, for example with Blinka, this module is used by
+:py:class:`~adafruit_display_text.bitmap_label.Label` in place of ``bitmaptools``
+whenever NumPy can be imported. It is not meant for CircuitPython boards, which have
+the native ``bitmaptools``.
+
+Bitmaps whose pixels can be read with one byte per pixel and no row padding, through the
+buffer protocol or like the :py:class:`~adafruit_display_text.headless.ArrayBitmap` as a
+NumPy array, are changed in place through array views, and their ``dirty()`` method is
+called afterwards. Other Bitmaps gain nothing from NumPy, so they are passed on to the
+installed ``bitmaptools``. Only when it lacks the function are their pixels read into
+arrays, and the pixels that change are written back.
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
+
+import displayio
+import numpy
+
+try:
+    import bitmaptools as _bitmaptools
+except ImportError:
+    _bitmaptools = None
+
+try:
+    from typing import Callable, Optional, Tuple
+except ImportError:
+    pass
+
+
+def _pixels(bitmap: displayio.Bitmap) -> Optional[numpy.ndarray]:
+    # A writable (height, width) view of the pixels of the bitmap, or None if its memory
+    # is not laid out with one byte per pixel
+    if getattr(bitmap, "bits_per_value", None) != 8:
+        return None
+    if hasattr(bitmap, "__array__"):  # for example an ArrayBitmap
+        pixels = numpy.asarray(bitmap)
+        if pixels.dtype != numpy.uint8 or not pixels.flags.c_contiguous:
+            return None
+        pixels = pixels.reshape(-1)
+    else:
+        try:
+            pixels = numpy.frombuffer(bitmap, dtype=numpy.uint8)
+        except (TypeError, ValueError):
+            return None
+    if pixels.size != bitmap.width * bitmap.height or not pixels.flags.writeable:
+        return None
+    return pixels.reshape(bitmap.height, bitmap.width)
+
+
+def _native(name: str, bitmap: displayio.Bitmap) -> Optional[Callable]:
+    # The function of the installed bitmaptools to call instead, when the pixels of the
+    # bitmap cannot be changed through an array view
+    if _bitmaptools is None or _pixels(bitmap) is not None:
+        return None
+    return getattr(_bitmaptools, name, None)
+
+
+def _region(
+    bitmap: displayio.Bitmap, x1: int, y1: int, x2: int, y2: int
+) -> Tuple[numpy.ndarray, bool]:
+    # The pixels of a rectangle of the bitmap, which must be inside it, and whether the
+    # array is a view of the bitmap rather than a copy
+    pixels = _pixels(bitmap)
+    if pixels is not None:
+        return pixels[y1:y2, x1:x2], True
+    region = numpy.empty((y2 - y1, x2 - x1), dtype=numpy.uint32)
+    for y in range(y1, y2):
+        row = region[y - y1]
+        for x in range(x1, x2):
+            row[x - x1] = bitmap[x, y]
+    return region, False
+
+
+def _store(
+    bitmap: displayio.Bitmap,
+    x: int,
+    y: int,
+    region: numpy.ndarray,
+    view: bool,
+    new_region: numpy.ndarray,
+) -> None:
+    # Write new_region over the region returned by _region() for the rectangle at x, y
+    rows, columns = numpy.nonzero(region != new_region)
+    if not len(rows):
+        return
+    if view:
+        region[rows, columns] = new_region[rows, columns]
+        dirty = getattr(bitmap, "dirty", None)
+        if dirty is not None:
+            dirty(
+                x + int(columns.min()),
+                y + int(rows.min()),
+                x + int(columns.max()) + 1,
+                y + int(rows.max()) + 1,
+            )
+    else:
+        for row, column in zip(rows.tolist(), columns.tolist()):
+            bitmap[x + column, y + row] = int(new_region[row, column])
+
+
+def blit(
+    dest_bitmap: displayio.Bitmap,
+    source_bitmap: displayio.Bitmap,
+    x: int,
+    y: int,
+    *,
+    x1: int = 0,
+    y1: int = 0,
+    x2: Optional[int] = None,
+    y2: Optional[int] = None,
+    skip_source_index: Optional[int] = None,
+    skip_dest_index: Optional[int] = None,
+) -> None:
+    """Copies a rectangle of ``source_bitmap`` into ``dest_bitmap`` at ``x``, ``y``, like
+    ``bitmaptools.blit()``. The parts that fall outside of ``dest_bitmap`` are skipped.
+
+    :param displayio.Bitmap dest_bitmap: The Bitmap to copy into
+    :param displayio.Bitmap source_bitmap: The Bitmap to copy from
+    :param int x: Horizontal position in ``dest_bitmap`` of the left edge of the rectangle
+    :param int y: Vertical position in ``dest_bitmap`` of the top edge of the rectangle
+    :param int x1: Left edge of the rectangle in ``source_bitmap``. Default is 0.
+    :param int y1: Top edge of the rectangle in ``source_bitmap``. Default is 0.
+    :param Optional[int] x2: Right edge, exclusive, of the rectangle in ``source_bitmap``.
+     Default is None, the width of ``source_bitmap``.
+    :param Optional[int] y2: Bottom edge, exclusive, of the rectangle in ``source_bitmap``.
+     Default is None, the height of ``source_bitmap``.
+    :param Optional[int] skip_source_index: Value of ``source_bitmap`` that is not copied.
+     Default is None, copy all the values.
+    :param Optional[int] skip_dest_index: Value of ``dest_bitmap`` that is not overwritten.
+     Default is None, overwrite all the values.
+    """
+    if x2 is None:
+        x2 = source_bitmap.width
+    if y2 is None:
+        y2 = source_bitmap.height
+    if x1 > x2:
+        x1, x2 = x2, x1
+    if y1 > y2:
+        y1, y2 = y2, y1
+    x2 = min(x2, source_bitmap.width)
+    y2 = min(y2, source_bitmap.height)
+
+    # clip the rectangle to both bitmaps
+    if x1 < 0:
+        x -= x1
+        x1 = 0
+    if y1 < 0:
+        y -= y1
+        y1 = 0
+    if x < 0:
+        x1 -= x
+        x = 0
+    if y < 0:
+        y1 -= y
+        y = 0
+    width = min(x2 - x1, dest_bitmap.width - x)
+    height = min(y2 - y1, dest_bitmap.height - y)
+    if width <= 0 or height <= 0:
+        return
+
+    native = _native("blit", dest_bitmap)
+    if native is not None:
+        native(
+            dest_bitmap,
+            source_bitmap,
+            x,
+            y,
+            x1=x1,
+            y1=y1,
+            x2=x1 + width,
+            y2=y1 + height,
+            skip_source_index=skip_source_index,
+            skip_dest_index=skip_dest_index,
+        )
+        return
+    source, _ = _region(source_bitmap, x1, y1, x1 + width, y1 + height)
+    target, view = _region(dest_bitmap, x, y, x + width, y + height)
+    copied = None
+    if skip_source_index is not None:
+        copied = source != skip_source_index
+    if skip_dest_index is not None:
+        overwritable = target != skip_dest_index
+        copied = overwritable if copied is None else copied & overwritable
+    if copied is None:
+        new_target = source.copy()  # the source may overlap the target
+    else:
+        new_target = numpy.where(copied, source, target)
+    _store(dest_bitmap, x, y, target, view, new_target)
+
+
+def fill_region(
+    dest_bitmap: displayio.Bitmap, x1: int, y1: int, x2: int, y2: int, value: int
+) -> None:
+    """Sets all the pixels of a rectangle to a value, like ``bitmaptools.fill_region()``.
+    The parts that fall outside of the bitmap are skipped.
+
+    :param displayio.Bitmap dest_bitmap: The Bitmap to fill
+    :param int x1: Left edge of the rectangle
+    :param int y1: Top edge of the rectangle
+    :param int x2: Right edge, exclusive, of the rectangle
+    :param int y2: Bottom edge, exclusive, of the rectangle
+    :param int value: The value to set
+    """
+    x1, x2 = max(min(x1, x2), 0), min(max(x1, x2), dest_bitmap.width)
+    y1, y2 = max(min(y1, y2), 0), min(max(y1, y2), dest_bitmap.height)
+    if x1 >= x2 or y1 >= y2:
+        return
+    native = _native("fill_region", dest_bitmap)
+    if native is not None:
+        native(dest_bitmap, x1, y1, x2, y2, value)
+        return
+    region, view = _region(dest_bitmap, x1, y1, x2, y2)
+    _store(dest_bitmap, x1, y1, region, view, numpy.full_like(region, value))
+
+
+def replace_color(dest_bitmap: displayio.Bitmap, old_color: int, new_color: int) -> None:
+    """Replaces a value in the whole bitmap, like ``bitmaptools.replace_color()``.
+
+    :param displayio.Bitmap dest_bitmap: The Bitmap to change
+    :param int old_color: The value to replace
+    :param int new_color: The value to replace it with
+    """
+    native = _native("replace_color", dest_bitmap)
+    if native is not None:
+        native(dest_bitmap, old_color, new_color)
+        return
+    region, view = _region(dest_bitmap, 0, 0, dest_bitmap.width, dest_bitmap.height)
+    _store(dest_bitmap, 0, 0, region, view, numpy.where(region == old_color, new_color, region))
+
+
+def dilate(
+    dest_bitmap: displayio.Bitmap,
+    size: int,
+    source_index: int,
+    value: int,
+    x1: int = 0,
+    x2: Optional[int] = None,
+) -> None:
+    """Draws an outline around the pixels of a value. Every pixel that is at most ``size``
+    pixels away, horizontally and vertically, from a pixel of ``source_index`` is set to
+    ``value``, except the pixels of ``source_index`` themselves. This is what stamping a
+    square of ``value`` over each of those pixels with ``bitmaptools.blit()`` and
+    ``skip_dest_index=source_index`` does, in one step.
+
+    :param displayio.Bitmap dest_bitmap: The Bitmap to draw into
+    :param int size: The size of the outline in pixels
+    :param int source_index: The value of the pixels to draw the outline around
+    :param int value: The value to draw the outline with
+    :param int x1: Only the pixels of ``source_index`` from this column on get an outline.
+     Default is 0.
+    :param Optional[int] x2: Only the pixels of ``source_index`` before this column get an
+     outline. Default is None, the width of the bitmap.
+    """
+    width = dest_bitmap.width
+    if x2 is None:
+        x2 = width
+    x1 = max(x1, 0)
+    x2 = min(x2, width)
+    if x1 >= x2:
+        return
+    # the outline can reach size pixels further than the source pixels
+    left = max(x1 - size, 0)
+    right = min(x2 + size, width)
+    region, view = _region(dest_bitmap, left, 0, right, dest_bitmap.height)
+    is_source = region == source_index
+    source = is_source.copy()
+    source[:, : x1 - left] = False
+    source[:, x2 - left :] = False
+
+    # a square is spread along the rows, then the result along the columns
+    rows = source.copy()
+    for shift in range(1, size + 1):
+        rows[:, shift:] |= source[:, :-shift]
+        rows[:, :-shift] |= source[:, shift:]
+    outline = rows.copy()
+    for shift in range(1, size + 1):
+        outline[shift:] |= rows[:-shift]
+        outline[:-shift] |= rows[shift:]
+    outline &= ~is_source
+
+    _store(dest_bitmap, left, 0, region, view, numpy.where(outline, value, region))
@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_display_text.refresh`
+================================================================================
+
+Refresh a display with the latest state of many labels, no more often than it allows
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
+
+import adafruit_ticks
+
+from adafruit_display_text import _IDLE_SLEEP
+from adafruit_display_text.bitmap_label import Label, _union_area
+
+try:
+    from typing import Callable, Iterable, List, Optional, Tuple
+except ImportError:
+    pass
+
+
+def union_dirty_rects(
+    labels: Iterable[Label], clear: bool = True
+) -> Optional[Tuple[int, int, int, int]]:
+    """The rectangle of the display that contains the ``display_dirty_rect`` of all the labels,
+    for refreshing only that part of a display. Other objects in ``labels`` are skipped, so
+    a Group holding labels and other objects can be passed.
+
+    :param Iterable[Label] labels: The labels
+    :param bool clear: Whether to call ``clear_dirty_rect()`` of the labels. Default is True.
+    :return: The rectangle as (x, y, width, height), or None if no label changed
+    :rtype: Optional[Tuple[int, int, int, int]]
+    """
+    area = None
+    for label in labels:
+        if not isinstance(label, Label):
+            continue
+        rect = label.display_dirty_rect
+        if rect is not None:
+            area = _union_area(area, (rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3]))
+        if clear:
+            label.clear_dirty_rect()
+    if area is None:
+        return None
+    return area[0], area[1], area[2] - area[0], area[3] - area[1]
+
+
+class RefreshCoalescer:
+    """Refreshes a display with the latest state of many
+    :py:class:`~adafruit_display_text.bitmap_label.Label` objects, no more often than the
+    display allows. The labels are switched to ``coalesce`` mode, so setting their text or
+    style only records the change. When the display can be refreshed again, each label
+    renders its latest state once and the display is refreshed once, so the values that
+    were replaced in between are never drawn. This suits e-ink displays, which must wait
+    several seconds between refreshes.
+
+    The dirty rectangles of the labels are used to tell whether anything changed, and are
+    cleared by each refresh.
+
+    :param display: The display to refresh, with ``auto_refresh`` turned off. Its
+     ``time_to_refresh`` is respected when it has one, as e-ink displays do. Default is None,
+     nothing is refreshed and the return value of :py:meth:`refresh` tells when to do it.
+    :param Iterable[Label] labels: Labels to coalesce. Default is none, more labels can be
+     added with :py:meth:`add`.
+    :param float min_interval: The minimum number of seconds between two refreshes, on top
+     of the ``time_to_refresh`` of the display. Default is 0.
+    :param Optional[Callable[[], int]] clock: Function returning the current time in
+     milliseconds, in the form of ``adafruit_ticks.ticks_ms()``. For example a
+     :py:class:`~adafruit_display_text.animation.ManualClock`. Default is None,
+     ``adafruit_ticks.ticks_ms``.
+    """
+
+    def __init__(
+        self,
+        display=None,
+        labels: Iterable[Label] = (),
+        min_interval: float = 0,
+        clock: Optional[Callable[[], int]] = None,
+    ) -> None:
+        self._display = display
+        # id(label): label
+        self._labels = {}
+        self.min_interval = min_interval
+        self._clock = adafruit_ticks.ticks_ms if clock is None else clock
+        self._last_refresh = None
+        for label in labels:
+            self.add(label)
+
+    def add(self, label: Label) -> None:
+        """Start coalescing the changes of a label.
+
+        :param Label label: The label to add
+        """
+        label.coalesce = True
+        self._labels[id(label)] = label
+
+    def remove(self, label: Label) -> None:
+        """Stop coalescing the changes of a label. Its recorded changes are rendered.
+
+        :param Label label: The label to remove
+        """
+        del self._labels[id(label)]
+        label.coalesce = False
+
+    @property
+    def labels(self) -> List[Label]:
+        """The labels being coalesced."""
+        return list(self._labels.values())
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    @property
+    def pending(self) -> bool:
+        """Whether a label changed since the last refresh."""
+        return any(
+            label.pending or label.display_dirty_rect is not None for label in self._labels.values()
+        )
+
+    @property
+    def time_to_refresh(self) -> float:
+        """Time, in fractional seconds, until the display can be refreshed again.
+        0 when it can be refreshed now."""
+        wait = 0
+        if self._last_refresh is not None:
+            elapsed = adafruit_ticks.ticks_diff(self._clock(), self._last_refresh)
+            wait = max(int(self.min_interval * 1000) - elapsed, 0) / 1000
+        return max(wait, getattr(self._display, "time_to_refresh", 0))
+
+    def refresh(self, force: bool = False) -> bool:
+        """Render the recorded changes of the labels and refresh the display, if a label
+        changed and the display can be refreshed. Call it in the main loop of user code.
+
+        :param bool force: Render and refresh even if nothing changed, and without checking
+         ``min_interval``. The ``time_to_refresh`` of the display must still be waited for.
+         Default is False.
+        :return: bool refreshed: whether the labels were rendered and the display refreshed
+        """
+        if not force and (self.time_to_refresh > 0 or not self.pending):
+            return False
+        labels = self._labels.values()
+        for label in labels:
+            label.flush()
+        union_dirty_rects(labels)
+        if self._display is not None:
+            self._display.refresh()
+        self._last_refresh = self._clock()
+        return True
+
+    async def run(self) -> None:
+        """Coroutine that refreshes the display forever, as soon as a label changed and the
+        display can be refreshed. Run it as an ``asyncio`` task next to the tasks that change
+        the labels. Requires the ``asyncio`` library.
+        """
+        import asyncio  # noqa: PLC0415, only loaded by programs that refresh this way
+
+        while True:
+            if self.pending:
+                wait = self.time_to_refresh
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+                self.refresh()
+            await asyncio.sleep(_IDLE_SLEEP / 1000)
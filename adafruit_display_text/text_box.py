@@ -241,6 +241,7 @@ class TextBox(bitmap_label.Label):
             self._font = font
         if line_spacing is not None:
             self._line_spacing = line_spacing
+        self._dirty = 0
 
         # if text is not provided as a parameter (text is None), use the previous value.
         if text is None:
@@ -259,7 +260,7 @@ class TextBox(bitmap_label.Label):
             # Calculate the text bounding box
 
             # Calculate both "tight" and "loose" bounding box dimensions to match label for
-            # anchor_position calculations
+            # anchor_position calculations, reusing the cached layout if it is still valid
             (
                 box_x,  # noqa: F841, var assigned not used
                 tight_box_y,
@@ -267,10 +268,7 @@ class TextBox(bitmap_label.Label):
                 tight_y_offset,
                 loose_box_y,
                 loose_y_offset,
-            ) = self._text_bounding_box(
-                text,
-                self._font,
-            )  # calculate the box size for a tight and loose backgrounds
+            ) = self._get_text_layout(text)
 
             if self._background_tight:
                 box_y = tight_box_y
@@ -297,7 +295,8 @@ class TextBox(bitmap_label.Label):
                 or self._bitmap.width != self._width
                 or self._bitmap.height != self._height
             ):
-                new_bitmap = displayio.Bitmap(self._width, self._height, len(self._palette))
+                self._release_bitmap()
+                new_bitmap = self._acquire_bitmap(self._width, self._height)
                 self._bitmap = new_bitmap
             else:
                 self._bitmap.fill(0)
@@ -341,6 +340,7 @@ class TextBox(bitmap_label.Label):
                 self.width,
                 self.height,
             )
+        self._add_damage()
 
         if (
             scale is not None
@@ -384,7 +384,8 @@ class TextBox(bitmap_label.Label):
         self._original_text = self._full_text
         self._full_text = "\n".join(self.lines)
 
-        self._set_text(self._full_text, self.scale)
+        if not self._deferred():
+            self._set_text(self._full_text, self.scale)
 
     @property
     def align(self):
@@ -30,6 +30,7 @@ autodoc_mock_imports = [
     "adafruit_bitmap_font",
     "fontio",
     "bitmaptools",
+    "numpy",
 ]
 
 
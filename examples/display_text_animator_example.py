@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This example scrolls several labels at different speeds with one Animator,
+which reads the clock once per loop and only updates the labels that are due.
+"""
+
+import board
+import displayio
+import terminalio
+
+from adafruit_display_text.animation import Animator
+from adafruit_display_text.bitmap_label import Label
+
+display = board.DISPLAY
+main_group = displayio.Group()
+
+tickers = []
+for index, message in enumerate(
+    (
+        "Temperature 21.4C humidity 40%",
+        "Next bus in 4 minutes",
+        "Welcome to CircuitPython",
+    )
+):
+    ticker = Label(
+        terminalio.FONT,
+        text=message,
+        max_characters=12,
+        animate_time=0.2 + 0.1 * index,
+        scale=2,
+    )
+    ticker.anchor_point = (0, 0)
+    ticker.anchored_position = (4, 4 + 30 * index)
+    main_group.append(ticker)
+    tickers.append(ticker)
+
+animator = Animator(tickers)
+display.root_group = main_group
+display.auto_refresh = False
+while True:
+    needs_refresh, _ = animator.update()
+    if needs_refresh:
+        display.refresh()
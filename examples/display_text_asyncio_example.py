@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This example scrolls a label from an asyncio task while another task keeps
+running. The label sleeps between animation frames instead of polling update().
+
+Requires:
+asyncio - https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+
+Copy it from the current libraries bundle into the lib folder on your device.
+"""
+
+import asyncio
+
+import board
+import displayio
+import terminalio
+
+from adafruit_display_text.bitmap_label import Label
+
+display = board.DISPLAY
+display.auto_refresh = False
+main_group = displayio.Group()
+
+ticker = Label(
+    terminalio.FONT,
+    text="Scrolling from an asyncio task",
+    max_characters=16,
+    animate_time=0.2,
+    scale=2,
+)
+ticker.anchor_point = (0, 0)
+ticker.anchored_position = (4, 4)
+main_group.append(ticker)
+
+counter = Label(terminalio.FONT, text="0", scale=2)
+counter.anchor_point = (0, 0)
+counter.anchored_position = (4, 40)
+main_group.append(counter)
+display.root_group = main_group
+
+
+async def count():
+    seconds = 0
+    while True:
+        await asyncio.sleep(1)
+        seconds += 1
+        counter.text = str(seconds)
+        display.refresh()
+
+
+async def main():
+    await asyncio.gather(ticker.animate(display.refresh), count())
+
+
+asyncio.run(main())
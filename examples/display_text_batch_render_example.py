@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This example renders many price tags on a computer, using all of its cores,
+and saves each one as a PPM image.
+
+Requires NumPy and Blinka displayio on a computer running CPython:
+pip install numpy adafruit-blinka-displayio adafruit-circuitpython-bitmap-font
+"""
+
+from adafruit_display_text.headless import render_batch
+
+FONT = "fonts/LeagueSpartan-Bold-16.bdf"
+
+
+def price_tags():
+    for number in range(1000):
+        yield {
+            "font": FONT,
+            "text": f"Item {number}\n${number % 50}.99",
+            "color": 0x000000,
+            "background_color": 0xFFFFFF,
+            "padding_left": 4,
+            "padding_right": 4,
+            "padding_top": 4,
+            "padding_bottom": 4,
+            # the price in red
+            "accents": [(len(f"Item {number}\n"), 99, 0xFF0000, 0xFFFFFF, "foreground_background")],
+        }
+
+
+if __name__ == "__main__":
+    for index, pixels in render_batch(price_tags()):
+        height, width, _ = pixels.shape
+        with open(f"tag_{index}.ppm", "wb") as image:
+            image.write(f"P6 {width} {height} 255\n".encode())
+            image.write(pixels.tobytes())
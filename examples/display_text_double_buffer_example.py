@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This example scrolls a label that draws each frame into a second Bitmap.
+The next frame is drawn ahead while the loop waits, so update() only has
+to show it, and the display never shows a half drawn frame.
+"""
+
+import board
+import displayio
+import terminalio
+
+from adafruit_display_text.bitmap_label import Label
+
+display = board.DISPLAY
+main_group = displayio.Group()
+
+ticker = Label(
+    terminalio.FONT,
+    text="Double buffered scrolling with frames drawn ahead of time",
+    max_characters=16,
+    animate_time=0.15,
+    capacity=Label.CAPACITY_AUTO,
+    double_buffer=True,
+    scale=2,
+)
+ticker.anchor_point = (0, 0.5)
+ticker.anchored_position = (4, display.height // 2)
+main_group.append(ticker)
+
+display.root_group = main_group
+display.auto_refresh = False
+while True:
+    if ticker.update():
+        display.refresh()
+        ticker.render_ahead()
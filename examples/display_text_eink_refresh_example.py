@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This example counts up quickly on a MagTag. The labels only record each new
+value, and the latest one is drawn whenever the e-ink display can be refreshed.
+"""
+
+import time
+
+import board
+import displayio
+import terminalio
+
+from adafruit_display_text.bitmap_label import Label
+from adafruit_display_text.refresh import RefreshCoalescer
+
+display = board.DISPLAY
+main_group = displayio.Group()
+
+counter = Label(terminalio.FONT, text="0", color=0x000000, background_color=0xFFFFFF, scale=3)
+counter.anchor_point = (0.5, 0.5)
+counter.anchored_position = (display.width // 2, display.height // 2 - 20)
+main_group.append(counter)
+
+status = Label(terminalio.FONT, text="", color=0x000000, background_color=0xFFFFFF)
+status.anchor_point = (0.5, 0.5)
+status.anchored_position = (display.width // 2, display.height // 2 + 30)
+main_group.append(status)
+
+display.root_group = main_group
+coalescer = RefreshCoalescer(display, [counter, status], min_interval=5)
+
+count = 0
+while True:
+    count += 1
+    counter.text = str(count)
+    status.text = "odd" if count % 2 else "even"
+    if coalescer.refresh():
+        print("refreshed at", count)
+    time.sleep(0.01)
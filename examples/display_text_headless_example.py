@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This example renders a frame for the 296x128 display of a MagTag on a computer,
+without a display, and saves it as a PGM image.
+
+Requires NumPy and Blinka displayio on a computer running CPython:
+pip install numpy adafruit-blinka-displayio adafruit-circuitpython-bitmap-font
+"""
+
+import numpy
+import terminalio
+
+from adafruit_display_text.headless import render_rgb
+
+WIDTH = 296
+HEIGHT = 128
+
+frame = numpy.full((HEIGHT, WIDTH), 0xFF, dtype=numpy.uint8)
+
+for text, x, y, scale in (("Hello world", 10, 20, 3), ("Rendered without a display", 10, 80, 1)):
+    # black text on the white frame, the transparent background shows white
+    rgb = render_rgb(terminalio.FONT, text, background=0xFFFFFF, color=0x000000, scale=scale)
+    pixels = rgb[:, :, 0]
+    height, width = pixels.shape
+    frame[y : y + height, x : x + width] = pixels[: HEIGHT - y, : WIDTH - x]
+
+with open("magtag_frame.pgm", "wb") as image:
+    image.write(f"P5 {WIDTH} {HEIGHT} 255\n".encode())
+    image.write(frame.tobytes())
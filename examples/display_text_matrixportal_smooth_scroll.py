@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This example shows a smoothly scrolling marquee on a 64x32 Matrix Portal.
+Each character is rendered once as it scrolls into view and the text moves
+one pixel at a time.
+
+Requires:
+adafruit_matrixportal - https://github.com/adafruit/Adafruit_CircuitPython_MatrixPortal
+
+Copy it from the current libraries bundle into the lib folder on your device.
+"""
+
+import terminalio
+from adafruit_matrixportal.matrix import Matrix
+
+from adafruit_display_text.bitmap_label import Label
+
+matrix = Matrix()
+display = matrix.display
+
+scrolling_label = Label(
+    terminalio.FONT,
+    text="Hello world CircuitPython smooth scrolling",
+    max_characters=10,
+    scroll_mode=Label.SCROLL_RING,
+    scroll_speed=20,
+    animate_time=1 / 30,
+    color=0x00FF00,
+)
+scrolling_label.x = 2
+scrolling_label.y = 16
+display.root_group = scrolling_label
+display.auto_refresh = False
+while True:
+    if scrolling_label.update():
+        display.refresh()